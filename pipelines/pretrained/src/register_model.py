@@ -10,6 +10,7 @@ import argparse
 import json
 import sys
 from dataclasses import dataclass
+from typing import Any
 
 import mlflow
 import mlflow.transformers
@@ -53,6 +54,23 @@ class PretrainedRegistrationResult:
     error_message: str | None = None
 
 
+def _parse_metadata_json(text: str) -> dict[str, Any]:
+    """Parse the fetch step's metadata.json contents.
+
+    Raises:
+        ModelRegistrationError: If the text is not valid JSON or not a JSON object.
+    """
+    try:
+        metadata: dict[str, Any] = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ModelRegistrationError(f"Invalid metadata JSON: {e}") from e
+    if not isinstance(metadata, dict):
+        raise ModelRegistrationError(
+            f"Invalid metadata JSON: expected an object, got {type(metadata).__name__}"
+        )
+    return metadata
+
+
 def register_pretrained_model(
     metadata_path: str,
     model_name: str,
@@ -84,11 +102,10 @@ def register_pretrained_model(
     # Load metadata from fetch step
     try:
         with open(metadata_path) as f:
-            metadata = json.load(f)
+            metadata_text = f.read()
     except FileNotFoundError as e:
         raise ModelRegistrationError(f"Metadata file not found: {metadata_path}") from e
-    except json.JSONDecodeError as e:
-        raise ModelRegistrationError(f"Invalid metadata JSON: {e}") from e
+    metadata = _parse_metadata_json(metadata_text)
 
     model_id = metadata["model_id"]
     task = metadata["task"]
@@ -51,6 +51,10 @@ class StructuredFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record as a JSON string."""
+        return json.dumps(self.to_dict(record), default=str)
+
+    def to_dict(self, record: logging.LogRecord) -> dict[str, Any]:
+        """Build the structured payload for a log record."""
         log_data: dict[str, Any] = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "level": record.levelname,
@@ -85,7 +89,7 @@ class StructuredFormatter(logging.Formatter):
                 "traceback": self.formatException(record.exc_info),
             }
 
-        return json.dumps(log_data, default=str)
+        return log_data
 
 
 class HumanReadableFormatter(logging.Formatter):
@@ -214,8 +214,10 @@ def feature_engineering(
         else:
             X_transformed = X
 
-        # Combine features, target, and the split indicator
-        df_out = X_transformed.copy()
+        # Combine features, target, and the split indicator. X_transformed is
+        # a frame this function built (transform output or the drop() above)
+        # and is not read again, so extend it in place rather than copying.
+        df_out = X_transformed
         df_out[target_column] = y.values
         is_train = np.zeros(len(df_out), dtype=int)
         is_train[train_idx] = 1
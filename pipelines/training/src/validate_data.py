@@ -168,12 +168,14 @@ def validate_data(
                     f"{original_dtypes[col]} to {df[col].dtype}"
                 )
 
-        # Check for nulls
-        null_count = int(df.isnull().sum().sum())
+        # Check for nulls. Build the boolean mask once and reduce it as a
+        # plain ndarray; the per-column share comes from the same mask.
+        null_mask = df.isna()
+        null_count = int(null_mask.to_numpy().sum())
         logger.info(f"Total null values found: {null_count}")
 
         # Calculate null percentage per column
-        null_percentages = df.isnull().sum() / len(df)
+        null_percentages = null_mask.mean()
         columns_to_drop = null_percentages[null_percentages > null_threshold].index.tolist()
 
         if columns_to_drop:
@@ -206,7 +208,7 @@ def validate_data(
 
         # Optionally drop any remaining rows with nulls
         rows_removed = 0
-        if drop_all_null_rows and df.isnull().any().any():
+        if drop_all_null_rows and df.isna().to_numpy().any():
             rows_before = len(df)
             df = df.dropna()
             rows_removed = rows_before - len(df)
@@ -3,8 +3,8 @@ Pytest configuration and shared fixtures for MLOps Platform tests.
 """
 
 import sys
-import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 # Centralized path setup for standalone components not installed as packages
@@ -20,6 +20,60 @@ import pandas as pd  # noqa: E402
 import pytest  # noqa: E402
 from sklearn.datasets import load_iris  # noqa: E402
 
+from pipelines.shared.logging_utils import set_correlation_id  # noqa: E402
+
+
+def pytest_addoption(parser):
+    """Register opt-in flags for tests that leave the sandbox or take seconds."""
+    parser.addoption(
+        "--network",
+        action="store_true",
+        default=False,
+        help="Run tests marked 'network' (they require internet access).",
+    )
+    parser.addoption(
+        "--slow",
+        action="store_true",
+        default=False,
+        help="Run tests marked 'slow' (CI, make test-unit and make test-cov pass this).",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip network- and slow-marked tests unless their flag was passed.
+
+    Keeps the default unit-test run I/O-free: a download that blocks on DNS
+    or TLS should never be the reason a local run or CI job is slow. A bare
+    ``pytest`` also leaves out the few multi-second tests (grid search, pyfunc
+    save/load) so local iteration stays fast; CI runs everything.
+    """
+    skips = {
+        marker: pytest.mark.skip(reason=f"{reason} (use --{marker})")
+        for marker, reason in (
+            ("network", "requires internet access"),
+            ("slow", "slow test"),
+        )
+        if not config.getoption(f"--{marker}")
+    }
+    if not skips:
+        return
+    for item in items:
+        for marker, skip in skips.items():
+            if item.get_closest_marker(marker):
+                item.add_marker(skip)
+
+
+@pytest.fixture(autouse=True)
+def _reset_correlation_id():
+    """Start and end every test with no correlation ID set.
+
+    The ID lives in a ContextVar, so one test's value would otherwise leak
+    into whichever test runs next on the same xdist worker.
+    """
+    set_correlation_id("")
+    yield
+    set_correlation_id("")
+
 
 @pytest.fixture(scope="session")
 def iris_dataframe():
@@ -38,50 +92,63 @@ def iris_dataframe():
 
 
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def temp_dir(tmp_path):
+    """Create a temporary directory for test files.
 
+    Backed by pytest's tmp_path so each xdist worker gets its own base
+    directory and failed runs keep their files for inspection.
+    """
+    return tmp_path
 
-@pytest.fixture
-def iris_csv_path(temp_dir, iris_dataframe):
+
+@pytest.fixture(scope="module")
+def input_dir(tmp_path_factory):
+    """Directory for the read-only input CSVs below, created once per module.
+
+    No test writes to these files, so writing them per test only repeated
+    the same disk I/O; outputs still go to the per-test temp_dir.
+    """
+    return tmp_path_factory.mktemp("inputs")
+
+
+@pytest.fixture(scope="module")
+def iris_csv_path(input_dir, iris_dataframe):
     """Create a temporary CSV file with iris data."""
-    csv_path = temp_dir / "iris.csv"
+    csv_path = input_dir / "iris.csv"
     iris_dataframe.to_csv(csv_path, index=False)
     return str(csv_path)
 
 
-@pytest.fixture
-def malformed_csv_path(temp_dir):
+@pytest.fixture(scope="module")
+def malformed_csv_path(input_dir):
     """Create a malformed CSV file for negative testing."""
-    csv_path = temp_dir / "malformed.csv"
+    csv_path = input_dir / "malformed.csv"
     csv_path.write_text('col1,col2,col3\n1,2\n3,4,5,6\n"unclosed')
     return str(csv_path)
 
 
-@pytest.fixture
-def empty_csv_path(temp_dir):
+@pytest.fixture(scope="module")
+def empty_csv_path(input_dir):
     """Create an empty CSV file (headers only)."""
-    csv_path = temp_dir / "empty.csv"
+    csv_path = input_dir / "empty.csv"
     csv_path.write_text("col1,col2,col3\n")
     return str(csv_path)
 
 
-@pytest.fixture
-def all_null_csv_path(temp_dir):
+@pytest.fixture(scope="module")
+def all_null_csv_path(input_dir):
     """Create a CSV file with all null values (Iris columns)."""
-    csv_path = temp_dir / "all_null.csv"
+    csv_path = input_dir / "all_null.csv"
     csv_path.write_text(
         "sepal_length,sepal_width,petal_length,petal_width,species\n,,,,\n,,,,\n,,,,\n"
     )
     return str(csv_path)
 
 
-@pytest.fixture
-def csv_with_nulls_path(temp_dir):
+@pytest.fixture(scope="module")
+def csv_with_nulls_path(input_dir):
     """Create a CSV file with some null values that can still be cleaned."""
-    csv_path = temp_dir / "with_nulls.csv"
+    csv_path = input_dir / "with_nulls.csv"
     # 15 rows total, 5 with nulls = 10 clean rows (meets minimum)
     data = """sepal_length,sepal_width,petal_length,petal_width,species
 5.1,3.5,1.4,0.2,setosa
@@ -104,10 +171,10 @@ def csv_with_nulls_path(temp_dir):
     return str(csv_path)
 
 
-@pytest.fixture
-def numeric_only_csv_path(temp_dir):
+@pytest.fixture(scope="module")
+def numeric_only_csv_path(input_dir):
     """Create a CSV file with only numeric columns."""
-    csv_path = temp_dir / "numeric.csv"
+    csv_path = input_dir / "numeric.csv"
     data = """a,b,c,target
 1.0,2.0,3.0,0
 4.0,5.0,6.0,1
@@ -125,40 +192,33 @@ def numeric_only_csv_path(temp_dir):
     return str(csv_path)
 
 
-@pytest.fixture
-def mock_mlflow_client(mocker):
-    """Create a mock MLflow client for register_model tests."""
-    mock_client = MagicMock()
+class _StubMlflowRun:
+    """Stand-in for the run returned by ``with mlflow.start_run() as run``.
 
-    # Mock run with metrics
-    mock_run = MagicMock()
-    mock_run.data.metrics = {"accuracy": 0.95, "f1_score": 0.94}
-    mock_client.get_run.return_value = mock_run
+    Code under test only reads ``run.info.run_id``, so a plain object is
+    enough - there are no calls worth recording on it.
+    """
 
-    # Mock model version
-    mock_version = MagicMock()
-    mock_version.version = "1"
-    mocker.patch("mlflow.register_model", return_value=mock_version)
+    def __init__(self, run_id):
+        self.info = SimpleNamespace(run_id=run_id)
 
-    mocker.patch("mlflow.set_tracking_uri")
-    # Patch where it's used, not where it's defined
-    mocker.patch(
-        "pipelines.training.src.register_model.MlflowClient",
-        return_value=mock_client,
-    )
+    def __enter__(self):
+        return self
 
-    return mock_client
+    def __exit__(self, *exc_info):
+        return False
 
 
-@pytest.fixture
-def mock_mlflow_client_low_accuracy(mocker):
-    """Create a mock MLflow client with low accuracy for threshold tests."""
-    mock_client = MagicMock()
+@pytest.fixture(scope="session")
+def mlflow_run_stub():
+    """Factory for stub MLflow runs: ``mlflow_run_stub("run-123")``."""
+    return _StubMlflowRun
 
-    # Mock run with low accuracy
-    mock_run = MagicMock()
-    mock_run.data.metrics = {"accuracy": 0.5, "f1_score": 0.45}
-    mock_client.get_run.return_value = mock_run
+
+def _patch_mlflow_client(mocker, metrics):
+    """Patch register_model's MLflow client to report the given run metrics."""
+    mock_client = MagicMock()
+    mock_client.get_run.return_value.data.metrics = metrics
 
     mocker.patch("mlflow.set_tracking_uri")
     # Patch where it's used, not where it's defined
@@ -166,14 +226,33 @@ def mock_mlflow_client_low_accuracy(mocker):
         "pipelines.training.src.register_model.MlflowClient",
         return_value=mock_client,
     )
-
     return mock_client
 
 
 @pytest.fixture
-def csv_with_categorical_path(temp_dir):
+def mock_mlflow_client(mocker):
+    """Create a mock MLflow client for register_model tests.
+
+    Function-scoped on purpose: tests rewrite the run metrics or re-patch
+    mlflow.register_model, and pytest-mock's mocker is itself per-test.
+    """
+    mock_version = MagicMock()
+    mock_version.version = "1"
+    mocker.patch("mlflow.register_model", return_value=mock_version)
+
+    return _patch_mlflow_client(mocker, {"accuracy": 0.95, "f1_score": 0.94})
+
+
+@pytest.fixture
+def mock_mlflow_client_low_accuracy(mocker):
+    """Create a mock MLflow client with low accuracy for threshold tests."""
+    return _patch_mlflow_client(mocker, {"accuracy": 0.5, "f1_score": 0.45})
+
+
+@pytest.fixture(scope="module")
+def csv_with_categorical_path(input_dir):
     """Create a CSV file with mixed numeric and categorical columns."""
-    csv_path = temp_dir / "categorical.csv"
+    csv_path = input_dir / "categorical.csv"
     data = """age,income,city,gender,target
 25,50000,NYC,M,0
 30,60000,LA,F,1
@@ -191,10 +270,10 @@ def csv_with_categorical_path(temp_dir):
     return str(csv_path)
 
 
-@pytest.fixture
-def csv_with_high_cardinality_path(temp_dir):
+@pytest.fixture(scope="module")
+def csv_with_high_cardinality_path(input_dir):
     """Create a CSV file with high cardinality categorical column."""
-    csv_path = temp_dir / "high_cardinality.csv"
+    csv_path = input_dir / "high_cardinality.csv"
     # 15 unique IDs - too many for encoding with max_categories=10
     data = """id,value,target
 id_001,10,0
@@ -218,19 +297,19 @@ id_015,150,0
 
 
 @pytest.fixture
-def trained_model_artifacts(temp_dir, iris_dataframe):
-    """Create artifacts needed for model training tests."""
-    # Save processed data
-    data_path = temp_dir / "processed.csv"
-    iris_dataframe.to_csv(data_path, index=False)
+def trained_model_artifacts(temp_dir, iris_csv_path):
+    """Create artifacts needed for model training tests.
 
+    The training data is the module-scoped iris CSV, written once; the
+    output paths are per test because train_model writes to them.
+    """
     # Create output paths
     model_path = temp_dir / "model.joblib"
     run_id_path = temp_dir / "run_id.txt"
     accuracy_path = temp_dir / "accuracy.txt"
 
     return {
-        "data_path": str(data_path),
+        "data_path": iris_csv_path,
         "model_path": str(model_path),
         "run_id_path": str(run_id_path),
         "accuracy_path": str(accuracy_path),
@@ -5,6 +5,7 @@ Tests that verify Terraform modules follow best practices and have proper config
 These tests can run without terraform init by parsing HCL files directly.
 """
 
+import os
 import re
 from pathlib import Path
 from typing import Any
@@ -14,33 +15,66 @@ import pytest
 PROJECT_ROOT = Path(__file__).parent.parent
 MODULES_DIR = PROJECT_ROOT / "infrastructure" / "terraform" / "modules"
 
+# Compiled once at import: the parsers run for every module-content test.
+_VAR_RE = re.compile(r'variable\s+"([^"]+)"\s*\{([^}]+)\}', re.DOTALL)
+_OUTPUT_RE = re.compile(r'output\s+"([^"]+)"\s*\{([^}]+)\}', re.DOTALL)
+# One pass per block collects every attribute the parsers care about. The
+# value stops before a trailing "#" or "//" comment unless it is inside a
+# quoted string, so `sensitive = true # secret` still reads as "true".
+_ATTR_RE = re.compile(
+    r'^\s*(description|sensitive|default|type)\s*=\s*("[^"\n]*"|.*?)\s*(?:(?:#|//).*)?$',
+    re.MULTILINE,
+)
+
+# Hardcoded password/secret/access key (a string literal, not a variable
+# reference) or an AWS access key ID, as one alternation so each file is
+# scanned once.
+_CRED_RE = re.compile(r'(?:password|secret_key|access_key)\s*=\s*"[^"$]|AKIA[0-9A-Z]{16}')
+
+# Variable names that must be marked sensitive. Suffix patterns avoid false
+# positives like "enable_kms_encryption", which contains "key" but is not a secret.
+_SENS_SUFFIXES = ("_password", "_secret", "_key", "_token", "_api_key")
+_SENS_EXACT = frozenset({"password", "secret", "api_key", "token"})
+
+# Per-module "has any of these keywords" checks, one case-insensitive search
+# over the raw module content each.
+_DATABASE_RES = {
+    "eks": re.compile(r"rds|postgresql", re.IGNORECASE),
+    "aks": re.compile(r"postgresql|flexible", re.IGNORECASE),
+    "gke": re.compile(r"cloudsql|sql_database", re.IGNORECASE),
+}
+_ENCRYPTION_RES = {
+    "eks": re.compile(r"kms|encrypt", re.IGNORECASE),
+    "aks": re.compile(r"key_vault|disk_encryption", re.IGNORECASE),
+    # GKE uses "ENCRYPTED_ONLY" for SSL
+    "gke": re.compile(r"kms|encryption|encrypted", re.IGNORECASE),
+}
+_NETWORK_RES = {
+    "eks": re.compile(r"vpc|subnet|security_group", re.IGNORECASE),
+    "aks": re.compile(r"vnet|subnet|network_security", re.IGNORECASE),
+    "gke": re.compile(r"network|subnetwork|firewall", re.IGNORECASE),
+}
+_AKS_MONITORING_RE = re.compile(r"azure_monitor|oms_agent|monitor_metrics", re.IGNORECASE)
+
 
 def parse_terraform_variables(tf_content: str) -> dict[str, Any]:
     """Extract variable definitions from Terraform content."""
     variables = {}
-    # Match variable blocks
-    var_pattern = r'variable\s+"([^"]+)"\s*\{([^}]+)\}'
-    for match in re.finditer(var_pattern, tf_content, re.DOTALL):
+    # Cheap literal check first: most files (main.tf, outputs.tf) have none.
+    if 'variable "' not in tf_content:
+        return variables
+    for match in _VAR_RE.finditer(tf_content):
         var_name = match.group(1)
         var_block = match.group(2)
 
+        attrs = {m.group(1): m.group(2) for m in _ATTR_RE.finditer(var_block)}
         var_info = {"name": var_name}
-
-        # Check for description
-        desc_match = re.search(r'description\s*=\s*"([^"]*)"', var_block)
-        if desc_match:
-            var_info["description"] = desc_match.group(1)
-
-        # Check for type
-        type_match = re.search(r"type\s*=\s*(\S+)", var_block)
-        if type_match:
-            var_info["type"] = type_match.group(1)
-
-        # Check for default
-        var_info["has_default"] = "default" in var_block
-
-        # Check for sensitive
-        var_info["sensitive"] = "sensitive" in var_block and "= true" in var_block
+        if "description" in attrs:
+            var_info["description"] = attrs["description"].strip('"')
+        if "type" in attrs:
+            var_info["type"] = attrs["type"]
+        var_info["has_default"] = "default" in attrs
+        var_info["sensitive"] = attrs.get("sensitive") == "true"
 
         variables[var_name] = var_info
 
@@ -50,37 +84,104 @@ def parse_terraform_variables(tf_content: str) -> dict[str, Any]:
 def parse_terraform_outputs(tf_content: str) -> dict[str, Any]:
     """Extract output definitions from Terraform content."""
     outputs = {}
-    output_pattern = r'output\s+"([^"]+)"\s*\{([^}]+)\}'
-    for match in re.finditer(output_pattern, tf_content, re.DOTALL):
+    if 'output "' not in tf_content:
+        return outputs
+    for match in _OUTPUT_RE.finditer(tf_content):
         output_name = match.group(1)
         output_block = match.group(2)
 
+        attrs = {m.group(1): m.group(2) for m in _ATTR_RE.finditer(output_block)}
         output_info = {"name": output_name}
-        output_info["has_description"] = "description" in output_block
-        output_info["sensitive"] = "sensitive" in output_block and "= true" in output_block
+        output_info["has_description"] = "description" in attrs
+        output_info["sensitive"] = attrs.get("sensitive") == "true"
 
         outputs[output_name] = output_info
 
     return outputs
 
 
+def _read_tf_files(module_path: Path) -> dict[Path, str]:
+    """Read every .tf file directly inside a module directory."""
+    files = {}
+    with os.scandir(module_path) as entries:
+        for entry in entries:
+            if entry.name.endswith(".tf") and entry.is_file():
+                with open(entry.path, "rb") as f:
+                    files[Path(entry.path)] = f.read().decode("utf-8")
+    return files
+
+
+@pytest.fixture(scope="session")
+def _tf_files() -> dict[Path, str]:
+    """Content of every .tf file under MODULES_DIR, read once per session."""
+    files = {}
+    with os.scandir(MODULES_DIR) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                files.update(_read_tf_files(Path(entry.path)))
+    return files
+
+
+@pytest.fixture(scope="session")
+def _module_contents(_tf_files) -> dict[str, dict[str, str]]:
+    """Raw and lowercased content of each cloud module, built from the file cache."""
+    contents = {}
+    for name in ("eks", "aks", "gke"):
+        module_dir = MODULES_DIR / name
+        if module_dir.exists():
+            txt = "\n".join(text for path, text in _tf_files.items() if path.parent == module_dir)
+            contents[name] = {"raw": txt, "lower": txt.lower()}
+    return contents
+
+
+def _cached_content(
+    module_contents: dict[str, dict[str, str]], module_name: str, form: str = "lower"
+) -> str:
+    """Return cached module content ("raw" or "lower"), skipping if the module is absent."""
+    if module_name not in module_contents:
+        pytest.skip(f"{module_name} module not found")
+    return module_contents[module_name][form]
+
+
+@pytest.fixture
+def module_content(module_path, _module_contents) -> str:
+    """Cached content of all .tf files in the test class's module."""
+    return _cached_content(_module_contents, module_path.name, "raw")
+
+
+@pytest.fixture
+def module_content_lower(module_path, _module_contents) -> str:
+    """Cached lowercased content of the test class's module."""
+    return _cached_content(_module_contents, module_path.name)
+
+
+class TestParsers:
+    """Tests for the HCL attribute parsing the module checks rely on."""
+
+    @pytest.mark.parametrize(
+        "line",
+        ["sensitive = true", "sensitive = true # secret", "sensitive   = true // secret"],
+        ids=["plain", "hash-comment", "slash-comment"],
+    )
+    def test_sensitive_with_trailing_comment(self, line):
+        """A trailing HCL comment must not hide `sensitive = true`."""
+        tf = f'variable "db_password" {{\n  type = string\n  {line}\n}}\n'
+        assert parse_terraform_variables(tf)["db_password"]["sensitive"] is True
+        tf = f'output "db_password" {{\n  value = var.db_password\n  {line}\n}}\n'
+        assert parse_terraform_outputs(tf)["db_password"]["sensitive"] is True
+
+
 class TestEKSModule:
     """Tests for the EKS Terraform module."""
 
+    pytestmark = pytest.mark.skipif(
+        not (MODULES_DIR / "eks").exists(), reason="EKS module not found"
+    )
+
     @pytest.fixture
     def module_path(self):
         return MODULES_DIR / "eks"
 
-    @pytest.fixture
-    def module_content(self, module_path) -> str:
-        """Read all .tf files in the module."""
-        if not module_path.exists():
-            pytest.skip("EKS module not found")
-        content = ""
-        for tf_file in module_path.glob("*.tf"):
-            content += tf_file.read_text() + "\n"
-        return content
-
     def test_module_has_required_files(self, module_path):
         """Verify module has standard Terraform files."""
         required_files = ["main.tf", "variables.tf", "outputs.tf"]
@@ -96,15 +197,9 @@ class TestEKSModule:
     def test_sensitive_variables_marked(self, module_content):
         """Sensitive variables should be marked as sensitive."""
         variables = parse_terraform_variables(module_content)
-        # Use suffix patterns to avoid false positives like "enable_kms_encryption"
-        # which contains "key" but is not a secret
-        sensitive_suffixes = ["_password", "_secret", "_key", "_token", "_api_key"]
-        sensitive_exact = ["password", "secret", "api_key", "token"]
         for var_name, var_info in variables.items():
             var_lower = var_name.lower()
-            is_sensitive_name = any(var_lower.endswith(s) for s in sensitive_suffixes) or any(
-                var_lower == s for s in sensitive_exact
-            )
+            is_sensitive_name = var_lower.endswith(_SENS_SUFFIXES) or var_lower in _SENS_EXACT
             if is_sensitive_name:
                 assert var_info.get("sensitive", False), (
                     f"Variable '{var_name}' appears sensitive but not marked"
@@ -116,12 +211,11 @@ class TestEKSModule:
         for output_name, output_info in outputs.items():
             assert output_info["has_description"], f"Output '{output_name}' missing description"
 
-    def test_encryption_enabled(self, module_content):
+    def test_encryption_enabled(self, module_content_lower):
         """Verify encryption is configured for data at rest."""
         # Check for KMS encryption
-        assert "kms" in module_content.lower() or "encrypt" in module_content.lower(), (
-            "EKS module should configure encryption"
-        )
+        content = module_content_lower
+        assert "kms" in content or "encrypt" in content, "EKS module should configure encryption"
 
     def test_private_endpoints_configurable(self, module_content):
         """Verify private endpoint access is configurable."""
@@ -129,11 +223,11 @@ class TestEKSModule:
             "EKS should have configurable private endpoint access"
         )
 
-    def test_logging_enabled(self, module_content):
+    def test_logging_enabled(self, module_content, module_content_lower):
         """Verify cluster logging is enabled."""
         # Check for either EKS cluster logging or VPC flow logs
         has_logging = (
-            "enabled_cluster_log_types" in module_content or "flow_log" in module_content.lower()
+            "enabled_cluster_log_types" in module_content or "flow_log" in module_content_lower
         )
         assert has_logging, "EKS should enable cluster or VPC flow logging"
 
@@ -141,19 +235,14 @@ class TestEKSModule:
 class TestAKSModule:
     """Tests for the AKS Terraform module."""
 
+    pytestmark = pytest.mark.skipif(
+        not (MODULES_DIR / "aks").exists(), reason="AKS module not found"
+    )
+
     @pytest.fixture
     def module_path(self):
         return MODULES_DIR / "aks"
 
-    @pytest.fixture
-    def module_content(self, module_path) -> str:
-        if not module_path.exists():
-            pytest.skip("AKS module not found")
-        content = ""
-        for tf_file in module_path.glob("*.tf"):
-            content += tf_file.read_text() + "\n"
-        return content
-
     def test_module_has_required_files(self, module_path):
         """Verify module has standard Terraform files."""
         required_files = ["main.tf", "variables.tf", "outputs.tf"]
@@ -166,9 +255,9 @@ class TestAKSModule:
         for var_name, var_info in variables.items():
             assert "description" in var_info, f"Variable '{var_name}' missing description"
 
-    def test_managed_identity_enabled(self, module_content):
+    def test_managed_identity_enabled(self, module_content_lower):
         """Verify managed identity is used."""
-        assert "identity" in module_content.lower(), "AKS should use managed identity"
+        assert "identity" in module_content_lower, "AKS should use managed identity"
 
     def test_network_policy_enabled(self, module_content):
         """Verify network policy is configured."""
@@ -177,30 +266,21 @@ class TestAKSModule:
     def test_azure_defender_configurable(self, module_content):
         """Verify Azure Defender/security center integration."""
         # Either Azure Monitor or Defender should be enabled
-        has_monitoring = (
-            "azure_monitor" in module_content.lower()
-            or "oms_agent" in module_content.lower()
-            or "monitor_metrics" in module_content.lower()
-        )
+        has_monitoring = _AKS_MONITORING_RE.search(module_content) is not None
         assert has_monitoring, "AKS should have monitoring configured"
 
 
 class TestGKEModule:
     """Tests for the GKE Terraform module."""
 
+    pytestmark = pytest.mark.skipif(
+        not (MODULES_DIR / "gke").exists(), reason="GKE module not found"
+    )
+
     @pytest.fixture
     def module_path(self):
         return MODULES_DIR / "gke"
 
-    @pytest.fixture
-    def module_content(self, module_path) -> str:
-        if not module_path.exists():
-            pytest.skip("GKE module not found")
-        content = ""
-        for tf_file in module_path.glob("*.tf"):
-            content += tf_file.read_text() + "\n"
-        return content
-
     def test_module_has_required_files(self, module_path):
         """Verify module has standard Terraform files."""
         required_files = ["main.tf", "variables.tf", "outputs.tf"]
@@ -213,18 +293,17 @@ class TestGKEModule:
         for var_name, var_info in variables.items():
             assert "description" in var_info, f"Variable '{var_name}' missing description"
 
-    def test_workload_identity_enabled(self, module_content):
+    def test_workload_identity_enabled(self, module_content, module_content_lower):
         """Verify Workload Identity is configured."""
         assert (
-            "workload_identity" in module_content.lower()
+            "workload_identity" in module_content_lower
             or "workload_metadata_config" in module_content
         ), "GKE should enable Workload Identity"
 
-    def test_shielded_nodes_enabled(self, module_content):
+    def test_shielded_nodes_enabled(self, module_content_lower):
         """Verify shielded nodes are configured."""
-        has_shielded = (
-            "shielded" in module_content.lower() or "secure_boot" in module_content.lower()
-        )
+        content = module_content_lower
+        has_shielded = "shielded" in content or "secure_boot" in content
         assert has_shielded, "GKE should configure shielded nodes"
 
     def test_private_cluster_configurable(self, module_content):
@@ -237,119 +316,68 @@ class TestGKEModule:
 class TestModuleConsistency:
     """Tests to verify consistency across all cloud modules."""
 
-    def test_all_modules_have_node_pool_configs(self):
+    @pytest.mark.parametrize("module_name", ["eks", "aks", "gke"])
+    def test_all_modules_have_node_pool_configs(self, _module_contents, module_name):
         """All cloud modules should have configurable node pools."""
-        for module_name in ["eks", "aks", "gke"]:
-            module_path = MODULES_DIR / module_name
-            if module_path.exists():
-                content = ""
-                for tf_file in module_path.glob("*.tf"):
-                    content += tf_file.read_text()
-
-                # Check for system and training node pools
-                has_system = "system" in content.lower()
-                has_training = "training" in content.lower()
-                has_gpu = "gpu" in content.lower()
-
-                assert has_system, f"{module_name} missing system node pool config"
-                assert has_training, f"{module_name} missing training node pool config"
-                assert has_gpu, f"{module_name} missing GPU node pool config"
-
-    def test_all_modules_have_database_config(self):
+        content = _cached_content(_module_contents, module_name)
+
+        # Check for system and training node pools
+        has_system = "system" in content
+        has_training = "training" in content
+        has_gpu = "gpu" in content
+
+        assert has_system, f"{module_name} missing system node pool config"
+        assert has_training, f"{module_name} missing training node pool config"
+        assert has_gpu, f"{module_name} missing GPU node pool config"
+
+    @pytest.mark.parametrize("module_name", ["eks", "aks", "gke"])
+    def test_all_modules_have_database_config(self, _module_contents, module_name):
         """All cloud modules should configure managed databases."""
-        db_patterns = {
-            "eks": ["rds", "postgresql"],
-            "aks": ["postgresql", "flexible"],
-            "gke": ["cloudsql", "sql_database"],
-        }
-
-        for module_name, patterns in db_patterns.items():
-            module_path = MODULES_DIR / module_name
-            if module_path.exists():
-                content = ""
-                for tf_file in module_path.glob("*.tf"):
-                    content += tf_file.read_text().lower()
-
-                has_db = any(p in content for p in patterns)
-                assert has_db, f"{module_name} missing database configuration"
-
-    def test_all_modules_output_cluster_endpoint(self):
+        content = _cached_content(_module_contents, module_name, "raw")
+
+        has_db = _DATABASE_RES[module_name].search(content) is not None
+        assert has_db, f"{module_name} missing database configuration"
+
+    @pytest.mark.parametrize("module_name", ["eks", "aks", "gke"])
+    def test_all_modules_output_cluster_endpoint(self, _tf_files, module_name):
         """All modules should output cluster endpoint."""
-        for module_name in ["eks", "aks", "gke"]:
-            module_path = MODULES_DIR / module_name
-            if module_path.exists():
-                outputs_file = module_path / "outputs.tf"
-                if outputs_file.exists():
-                    content = outputs_file.read_text()
-                    assert "endpoint" in content.lower(), (
-                        f"{module_name} should output cluster endpoint"
-                    )
-
-    def test_all_modules_use_tagging(self):
+        content = _tf_files.get(MODULES_DIR / module_name / "outputs.tf")
+        if content is None:
+            pytest.skip(f"{module_name} outputs.tf not found")
+        assert "endpoint" in content.lower(), f"{module_name} should output cluster endpoint"
+
+    @pytest.mark.parametrize(
+        ("module_name", "pattern"), [("eks", "tags"), ("aks", "tags"), ("gke", "labels")]
+    )
+    def test_all_modules_use_tagging(self, _tf_files, module_name, pattern):
         """All modules should support resource tagging/labeling."""
-        tag_patterns = {"eks": "tags", "aks": "tags", "gke": "labels"}
-
-        for module_name, pattern in tag_patterns.items():
-            module_path = MODULES_DIR / module_name / "variables.tf"
-            if module_path.exists():
-                content = module_path.read_text()
-                assert pattern in content.lower(), f"{module_name} should have {pattern} variable"
+        content = _tf_files.get(MODULES_DIR / module_name / "variables.tf")
+        if content is None:
+            pytest.skip(f"{module_name} variables.tf not found")
+        assert pattern in content.lower(), f"{module_name} should have {pattern} variable"
 
 
 class TestSecurityBestPractices:
     """Tests for security best practices across modules."""
 
-    def test_no_hardcoded_credentials(self):
+    def test_no_hardcoded_credentials(self, _tf_files):
         """Verify no hardcoded credentials in modules."""
-        dangerous_patterns = [
-            r'password\s*=\s*"[^"$]',  # Hardcoded password (not variable)
-            r'secret_key\s*=\s*"[^"$]',
-            r'access_key\s*=\s*"[^"$]',
-            r"AKIA[0-9A-Z]{16}",  # AWS access key pattern
-        ]
-
-        for module_dir in MODULES_DIR.iterdir():
-            if module_dir.is_dir():
-                for tf_file in module_dir.glob("*.tf"):
-                    content = tf_file.read_text()
-                    for pattern in dangerous_patterns:
-                        matches = re.findall(pattern, content)
-                        assert not matches, (
-                            f"Potential hardcoded credential in {tf_file}: {matches}"
-                        )
-
-    def test_encryption_at_rest(self):
+        for tf_file, content in _tf_files.items():
+            match = _CRED_RE.search(content)
+            assert match is None, f"Potential hardcoded credential in {tf_file}: {match.group(0)}"
+
+    @pytest.mark.parametrize("module_name", ["eks", "aks", "gke"])
+    def test_encryption_at_rest(self, _module_contents, module_name):
         """Verify encryption at rest is configured."""
-        encryption_keywords = {
-            "eks": ["kms", "encrypt"],
-            "aks": ["key_vault", "disk_encryption"],
-            "gke": ["kms", "encryption", "encrypted"],  # GKE uses "ENCRYPTED_ONLY" for SSL
-        }
-
-        for module_name, keywords in encryption_keywords.items():
-            module_path = MODULES_DIR / module_name
-            if module_path.exists():
-                content = ""
-                for tf_file in module_path.glob("*.tf"):
-                    content += tf_file.read_text().lower()
-
-                has_encryption = any(kw in content for kw in keywords)
-                assert has_encryption, f"{module_name} should configure encryption at rest"
-
-    def test_network_isolation(self):
+        content = _cached_content(_module_contents, module_name, "raw")
+
+        has_encryption = _ENCRYPTION_RES[module_name].search(content) is not None
+        assert has_encryption, f"{module_name} should configure encryption at rest"
+
+    @pytest.mark.parametrize("module_name", ["eks", "aks", "gke"])
+    def test_network_isolation(self, _module_contents, module_name):
         """Verify network isolation is configured."""
-        network_keywords = {
-            "eks": ["vpc", "subnet", "security_group"],
-            "aks": ["vnet", "subnet", "network_security"],
-            "gke": ["network", "subnetwork", "firewall"],
-        }
-
-        for module_name, keywords in network_keywords.items():
-            module_path = MODULES_DIR / module_name
-            if module_path.exists():
-                content = ""
-                for tf_file in module_path.glob("*.tf"):
-                    content += tf_file.read_text().lower()
-
-                has_network = any(kw in content for kw in keywords)
-                assert has_network, f"{module_name} should configure network isolation"
+        content = _cached_content(_module_contents, module_name, "raw")
+
+        has_network = _NETWORK_RES[module_name].search(content) is not None
+        assert has_network, f"{module_name} should configure network isolation"
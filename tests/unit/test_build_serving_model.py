@@ -11,15 +11,18 @@ from pipelines.shared.exceptions import ModelTrainingError
 from pipelines.training.src.build_serving_model import PreprocessingModel
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def iris_features(iris_dataframe):
     """Return feature-only iris DataFrame (no target)."""
     return iris_dataframe.drop(columns=["species"])
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def fitted_preprocessor(iris_features):
-    """Fit a ColumnTransformer on iris numeric features."""
+    """Fit a ColumnTransformer on iris numeric features.
+
+    Module-scoped: no test refits or mutates it, so one fit is shared.
+    """
     numeric_cols = iris_features.select_dtypes(include="number").columns.tolist()
     preprocessor = ColumnTransformer(
         transformers=[("scaler", StandardScaler(), numeric_cols)],
@@ -30,16 +33,24 @@ def fitted_preprocessor(iris_features):
     return preprocessor
 
 
-@pytest.fixture
-def trained_rf(iris_dataframe, fitted_preprocessor):
-    """Train a RandomForest on preprocessed iris features."""
-    X = iris_dataframe.drop(columns=["species"])
-    y = iris_dataframe["species"]
+@pytest.fixture(scope="module")
+def trained_rf(iris_dataframe, iris_features, fitted_preprocessor):
+    """Train a RandomForest on preprocessed iris features.
 
-    X_transformed = fitted_preprocessor.transform(X)
+    Module-scoped like the preprocessor: tests only predict with or pickle it.
+    """
+    X_transformed = fitted_preprocessor.transform(iris_features)
 
     model = RandomForestClassifier(n_estimators=10, max_depth=3, random_state=42)
-    model.fit(X_transformed, y)
+    model.fit(X_transformed, iris_dataframe["species"])
+    return model
+
+
+@pytest.fixture(scope="module")
+def raw_rf(iris_dataframe, iris_features):
+    """Train a RandomForest directly on unscaled iris features."""
+    model = RandomForestClassifier(n_estimators=10, random_state=42)
+    model.fit(iris_features, iris_dataframe["species"])
     return model
 
 
@@ -56,19 +67,13 @@ class TestPreprocessingModel:
         preds = wrapper.predict(context=None, model_input=iris_features)
         assert isinstance(preds, np.ndarray)
         assert len(preds) == len(iris_features)
-        assert set(preds).issubset({"setosa", "versicolor", "virginica"})
+        assert np.isin(preds, ["setosa", "versicolor", "virginica"]).all()
 
-    def test_predict_without_preprocessor(self, iris_dataframe):
+    def test_predict_without_preprocessor(self, raw_rf, iris_features):
         """Test prediction works when no preprocessor is provided."""
-        X = iris_dataframe.drop(columns=["species"])
-        y = iris_dataframe["species"]
-
-        model = RandomForestClassifier(n_estimators=10, random_state=42)
-        model.fit(X, y)
-
-        wrapper = PreprocessingModel(model=model)
-        preds = wrapper.predict(context=None, model_input=X)
-        assert len(preds) == len(X)
+        wrapper = PreprocessingModel(model=raw_rf)
+        preds = wrapper.predict(context=None, model_input=iris_features)
+        assert len(preds) == len(iris_features)
 
     def test_predict_single_row(self, trained_rf, fitted_preprocessor):
         """Test prediction on a single input row."""
@@ -105,6 +110,7 @@ class TestBuildServingModelErrors:
             )
 
 
+@pytest.mark.slow
 class TestLocalServingCopy:
     """The local pyfunc copy feeds the serving-load-test workflow gate."""
 
@@ -1,5 +1,8 @@
 """Unit tests for feature_engineering module."""
 
+from types import SimpleNamespace
+
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -13,14 +16,25 @@ from pipelines.training.src.feature_engineering import (
 )
 
 
+@pytest.fixture(scope="module")
+def iris_run(tmp_path_factory, iris_csv_path):
+    """Run feature_engineering on iris once and share the result and output.
+
+    Module-scoped: the tests using it only inspect the result and the
+    output file, so one run (and one read of its CSV) is enough.
+    """
+    output_path = tmp_path_factory.mktemp("iris_features") / "features.csv"
+
+    result = feature_engineering(iris_csv_path, str(output_path), "species")
+    return SimpleNamespace(result=result, output_path=output_path, df=pd.read_csv(output_path))
+
+
 class TestFeatureEngineering:
     """Tests for feature_engineering function."""
 
-    def test_successful_feature_engineering(self, iris_csv_path, temp_dir):
+    def test_successful_feature_engineering(self, iris_run):
         """Test successful feature engineering on iris data."""
-        output_path = str(temp_dir / "features.csv")
-
-        result = feature_engineering(iris_csv_path, output_path, "species")
+        result = iris_run.result
 
         assert isinstance(result, FeatureEngineeringResult)
         assert result.success is True
@@ -29,38 +43,23 @@ class TestFeatureEngineering:
         assert result.output_shape == (150, 6)
         assert len(result.scaled_columns) == 4  # 4 numeric columns
 
-    def test_numeric_columns_scaled(self, iris_csv_path, temp_dir):
+    def test_numeric_columns_scaled(self, iris_run):
         """Test that numeric columns are scaled to zero mean."""
-        output_path = str(temp_dir / "features.csv")
-
-        feature_engineering(iris_csv_path, output_path, "species")
-
-        # Read output and verify scaling
-        df = pd.read_csv(output_path)
+        df = iris_run.df
         # ColumnTransformer prefixes column names with transformer name
         scaler_cols = [c for c in df.columns if c.startswith("scaler__")]
 
         # The scaler is fitted on the TRAIN partition only (leakage-free),
         # so exact zero mean holds on train rows; held-out rows are merely
         # transformed and their mean will be near - not exactly - zero.
-        train_rows = df[df["is_train"] == 1]
-        for col in scaler_cols:
-            assert abs(train_rows[col].mean()) < 1e-10
-            assert abs(df[col].mean()) < 0.5  # sanity: same distribution family
+        scaled = df[scaler_cols].to_numpy(dtype=np.float64)
+        train_means = scaled[df["is_train"].to_numpy() == 1].mean(axis=0)
+        np.testing.assert_allclose(train_means, 0.0, atol=1e-10)
+        assert (np.abs(scaled.mean(axis=0)) < 0.5).all()  # sanity: same distribution family
 
-    def test_target_column_preserved(self, iris_csv_path, temp_dir):
+    def test_target_column_preserved(self, iris_run, iris_dataframe):
         """Test that target column is not modified."""
-        output_path = str(temp_dir / "features.csv")
-
-        # Read original target values
-        df_original = pd.read_csv(iris_csv_path)
-        original_target = df_original["species"].tolist()
-
-        feature_engineering(iris_csv_path, output_path, "species")
-
-        # Verify target is unchanged
-        df_output = pd.read_csv(output_path)
-        assert df_output["species"].tolist() == original_target
+        assert iris_run.df["species"].tolist() == iris_dataframe["species"].tolist()
 
     def test_missing_target_column(self, iris_csv_path, temp_dir):
         """Test error when target column doesn't exist."""
@@ -87,11 +86,9 @@ class TestFeatureEngineering:
         assert "c" in result.scaled_columns
         assert "target" not in result.scaled_columns
 
-    def test_result_dataclass_fields(self, iris_csv_path, temp_dir):
+    def test_result_dataclass_fields(self, iris_run):
         """Test that FeatureEngineeringResult contains expected fields."""
-        output_path = str(temp_dir / "features.csv")
-
-        result = feature_engineering(iris_csv_path, output_path, "species")
+        result = iris_run.result
 
         assert hasattr(result, "output_path")
         assert hasattr(result, "preprocessor_path")
@@ -102,14 +99,10 @@ class TestFeatureEngineering:
         assert hasattr(result, "success")
         assert hasattr(result, "error_message")
 
-    def test_output_file_created(self, iris_csv_path, temp_dir):
+    def test_output_file_created(self, iris_run):
         """Test that output file is created after feature engineering."""
-        output_path = temp_dir / "features.csv"
-
-        result = feature_engineering(iris_csv_path, str(output_path), "species")
-
-        assert output_path.exists()
-        assert result.output_path == str(output_path)
+        assert iris_run.output_path.exists()
+        assert iris_run.result.output_path == str(iris_run.output_path)
 
     def test_categorical_encoding(self, csv_with_categorical_path, temp_dir):
         """Test one-hot encoding of categorical columns."""
@@ -123,8 +116,8 @@ class TestFeatureEngineering:
         # Output should have more columns due to one-hot encoding
         assert result.output_shape[1] > result.input_shape[1]
 
-        # Verify encoded columns in output
-        df = pd.read_csv(output_path)
+        # Verify encoded columns in output (header only)
+        df = pd.read_csv(output_path, nrows=0)
         # ColumnTransformer prefixes with "encoder__"
         city_cols = [c for c in df.columns if "city" in c.lower()]
         assert len(city_cols) > 0
@@ -150,7 +143,7 @@ class TestFeatureEngineering:
 
         assert result.success is True
         # id column should be dropped (15 unique > 10 max)
-        df = pd.read_csv(output_path)
+        df = pd.read_csv(output_path, nrows=0)
         id_cols = [c for c in df.columns if "id" in c.lower() and c != "target"]
         assert len(id_cols) == 0
         # But value column should still exist (scaled)
@@ -1,21 +1,27 @@
 """Tests for the HuggingFace pretrained model fetch pipeline step."""
 
+import importlib
 import json
 import os
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
-from pipelines.pretrained.src.fetch_model import (
-    DEFAULT_TEST_INPUTS,
-    fetch_model,
-)
+
+@pytest.fixture(scope="session")
+def _fetch_base_dir(tmp_path_factory):
+    """One base directory for every fetch_model test in the session."""
+    return tmp_path_factory.mktemp("hf-model")
 
 
 @pytest.fixture
-def output_dir(tmp_path):
-    """Create a temporary output directory."""
-    return str(tmp_path / "hf-model")
+def output_dir(_fetch_base_dir, request):
+    """Per-test output directory under the shared base.
+
+    Not created here: fetch_model makes it, as it does in the pipeline.
+    """
+    return str(_fetch_base_dir / request.node.name)
 
 
 RESOLVED_SHA = "714eb0fa89d2f80546fda750413ed43d93601a13"
@@ -29,26 +35,52 @@ def _hub_info(pipeline_tag=None, safetensors=None, sha=RESOLVED_SHA):
     return info
 
 
+@pytest.fixture(scope="session")
+def fetch_model_module():
+    """Import the fetch_model module on first use instead of at collection.
+
+    It pulls in transformers, which takes seconds to import. The hub
+    fixture patches through this module object because monkeypatch.setattr
+    resolves a dotted string by attribute access, and the package
+    __init__ rebinds ``fetch_model`` to the function of the same name.
+    """
+    return importlib.import_module("pipelines.pretrained.src.fetch_model")
+
+
+@pytest.fixture
+def fetch_model(fetch_model_module):
+    """The fetch_model step function."""
+    return fetch_model_module.fetch_model
+
+
+@pytest.fixture(autouse=True)
+def hub(monkeypatch, fetch_model_module):
+    """Patch the Hub lookup and pipeline factory with pre-wired mocks.
+
+    Tests override only what they assert on: ``hub.model_info`` /
+    ``hub.pipeline`` return values or side effects, or the ``hub.pipe``
+    pipeline object the factory returns.
+    """
+    pipe = MagicMock()
+    pipe.return_value = [{"label": "POSITIVE", "score": 0.9}]
+    mock_pipeline = MagicMock(return_value=pipe)
+    mock_model_info = MagicMock(return_value=_hub_info())
+    monkeypatch.setattr(fetch_model_module, "pipeline", mock_pipeline)
+    monkeypatch.setattr(fetch_model_module, "model_info", mock_model_info)
+    return SimpleNamespace(pipeline=mock_pipeline, model_info=mock_model_info, pipe=pipe)
+
+
 class TestFetchModel:
     """Tests for the fetch_model function."""
 
-    @patch("pipelines.pretrained.src.fetch_model.pipeline")
-    @patch("pipelines.pretrained.src.fetch_model.model_info")
-    def test_fetch_model_success(self, mock_model_info, mock_pipeline, output_dir):
+    def test_fetch_model_success(self, hub, fetch_model, output_dir):
         """Test successful model fetch and validation."""
-        # Mock model info
         safetensors = MagicMock()
         safetensors.total = 66_000_000
-        mock_model_info.return_value = _hub_info(
+        hub.model_info.return_value = _hub_info(
             pipeline_tag="text-classification", safetensors=safetensors
         )
-
-        # Mock pipeline
-        mock_pipe = MagicMock()
-        mock_pipe.return_value = [{"label": "POSITIVE", "score": 0.9998}]
-        mock_pipe.model = MagicMock()
-        mock_pipe.tokenizer = MagicMock()
-        mock_pipeline.return_value = mock_pipe
+        hub.pipe.return_value = [{"label": "POSITIVE", "score": 0.9998}]
 
         result = fetch_model(
             model_id="distilbert/distilbert-base-uncased-finetuned-sst-2-english",
@@ -74,19 +106,12 @@ class TestFetchModel:
         assert result.resolved_revision == RESOLVED_SHA
 
         # Verify model was saved
-        mock_pipe.model.save_pretrained.assert_called_once()
-        mock_pipe.tokenizer.save_pretrained.assert_called_once()
+        hub.pipe.model.save_pretrained.assert_called_once()
+        hub.pipe.tokenizer.save_pretrained.assert_called_once()
 
-    @patch("pipelines.pretrained.src.fetch_model.pipeline")
-    @patch("pipelines.pretrained.src.fetch_model.model_info")
-    def test_fetch_model_custom_test_input(self, mock_model_info, mock_pipeline, output_dir):
+    def test_fetch_model_custom_test_input(self, hub, fetch_model, output_dir):
         """Test with custom test input."""
-        mock_model_info.return_value = _hub_info()
-        mock_pipe = MagicMock()
-        mock_pipe.return_value = [{"label": "NEGATIVE", "score": 0.95}]
-        mock_pipe.model = MagicMock()
-        mock_pipe.tokenizer = MagicMock()
-        mock_pipeline.return_value = mock_pipe
+        hub.pipe.return_value = [{"label": "NEGATIVE", "score": 0.95}]
 
         result = fetch_model(
             model_id="test-model",
@@ -97,90 +122,65 @@ class TestFetchModel:
 
         assert result.success is True
         assert result.test_input == "This is terrible!"
-        mock_pipe.assert_called_once_with("This is terrible!")
-
-    @patch("pipelines.pretrained.src.fetch_model.pipeline")
-    @patch("pipelines.pretrained.src.fetch_model.model_info")
-    def test_fetch_model_download_failure(self, mock_model_info, mock_pipeline, output_dir):
-        """Test failure when model download fails."""
-        mock_model_info.return_value = _hub_info()
-        mock_pipeline.side_effect = OSError("Connection failed")
-
-        with pytest.raises(RuntimeError, match="Failed to download model"):
-            fetch_model(model_id="bad/model", output_dir=output_dir)
-
-    @patch("pipelines.pretrained.src.fetch_model.pipeline")
-    @patch("pipelines.pretrained.src.fetch_model.model_info")
-    def test_fetch_model_inference_failure(self, mock_model_info, mock_pipeline, output_dir):
-        """Test failure when sanity inference fails."""
-        mock_model_info.return_value = _hub_info()
-        mock_pipe = MagicMock()
-        mock_pipe.side_effect = RuntimeError("Inference error")
-        mock_pipeline.return_value = mock_pipe
-
-        with pytest.raises(RuntimeError, match="Sanity inference failed"):
+        hub.pipe.assert_called_once_with("This is terrible!")
+
+    @pytest.mark.parametrize(
+        ("target", "error", "match"),
+        [
+            ("pipeline", OSError("Connection failed"), "Failed to download model"),
+            ("pipe", RuntimeError("Inference error"), "Sanity inference failed"),
+        ],
+        ids=["download", "inference"],
+    )
+    def test_fetch_model_step_failure(self, hub, fetch_model, output_dir, target, error, match):
+        """Test failure when the model download or sanity inference fails."""
+        getattr(hub, target).side_effect = error
+
+        with pytest.raises(RuntimeError, match=match):
             fetch_model(model_id="test/model", output_dir=output_dir)
 
-    @patch("pipelines.pretrained.src.fetch_model.pipeline")
-    @patch("pipelines.pretrained.src.fetch_model.model_info")
-    def test_fetch_model_unresolvable_revision_is_fatal(
-        self, mock_model_info, mock_pipeline, output_dir
+    @pytest.mark.parametrize(
+        ("attr", "value", "match"),
+        [
+            ("side_effect", Exception("API rate limit"), "Could not resolve"),
+            ("return_value", _hub_info(sha=None), "no commit SHA"),
+        ],
+        ids=["lookup-error", "missing-sha"],
+    )
+    def test_fetch_model_unresolved_revision_is_fatal(
+        self, hub, fetch_model, output_dir, attr, value, match
     ):
         """Revision resolution is a hard supply-chain gate, not best-effort:
-        without a resolved commit SHA the model has no provenance identity."""
-        mock_model_info.side_effect = Exception("API rate limit")
+        without a resolved commit SHA the model has no provenance identity,
+        whether the Hub lookup fails or returns metadata without a SHA."""
+        setattr(hub.model_info, attr, value)
 
-        with pytest.raises(RuntimeError, match="Could not resolve"):
+        with pytest.raises(RuntimeError, match=match):
             fetch_model(model_id="test/model", output_dir=output_dir)
-        mock_pipeline.assert_not_called()
+        hub.pipeline.assert_not_called()
 
-    @patch("pipelines.pretrained.src.fetch_model.pipeline")
-    @patch("pipelines.pretrained.src.fetch_model.model_info")
-    def test_fetch_model_missing_sha_is_fatal(self, mock_model_info, mock_pipeline, output_dir):
-        """Hub metadata without a commit SHA must also fail."""
-        mock_model_info.return_value = _hub_info(sha=None)
-
-        with pytest.raises(RuntimeError, match="no commit SHA"):
-            fetch_model(model_id="test/model", output_dir=output_dir)
-        mock_pipeline.assert_not_called()
-
-    @patch("pipelines.pretrained.src.fetch_model.pipeline")
-    @patch("pipelines.pretrained.src.fetch_model.model_info")
-    def test_fetch_model_rejects_pickle_weights(self, mock_model_info, mock_pipeline, output_dir):
+    def test_fetch_model_rejects_pickle_weights(self, hub, fetch_model, output_dir):
         """A .bin weight file in the saved artifact must fail the fetch -
         pickle-based weights execute arbitrary code on load."""
-        mock_model_info.return_value = _hub_info()
-        mock_pipe = MagicMock()
-        mock_pipe.return_value = [{"label": "POSITIVE", "score": 0.9}]
 
         def _save_with_pickle(path, **kwargs):
             with open(os.path.join(path, "pytorch_model.bin"), "wb") as f:
                 f.write(b"pickle")
 
-        mock_pipe.model.save_pretrained.side_effect = _save_with_pickle
-        mock_pipe.tokenizer = MagicMock()
-        mock_pipeline.return_value = mock_pipe
+        hub.pipe.model.save_pretrained.side_effect = _save_with_pickle
 
         with pytest.raises(RuntimeError, match="Pickle-based weight files"):
             fetch_model(model_id="test/model", output_dir=output_dir)
 
-    def test_default_test_inputs_has_text_classification(self):
+    def test_default_test_inputs_has_text_classification(self, fetch_model_module):
         """Test that default inputs cover text-classification."""
-        assert "text-classification" in DEFAULT_TEST_INPUTS
-        assert "sentiment-analysis" in DEFAULT_TEST_INPUTS
-        assert len(DEFAULT_TEST_INPUTS["text-classification"]) > 0
+        default_inputs = fetch_model_module.DEFAULT_TEST_INPUTS
+        assert "text-classification" in default_inputs
+        assert "sentiment-analysis" in default_inputs
+        assert len(default_inputs["text-classification"]) > 0
 
-    @patch("pipelines.pretrained.src.fetch_model.pipeline")
-    @patch("pipelines.pretrained.src.fetch_model.model_info")
-    def test_fetch_model_with_revision(self, mock_model_info, mock_pipeline, output_dir):
+    def test_fetch_model_with_revision(self, hub, fetch_model, output_dir):
         """Test fetch with specific revision."""
-        mock_model_info.return_value = _hub_info()
-        mock_pipe = MagicMock()
-        mock_pipe.return_value = [{"label": "POSITIVE", "score": 0.9}]
-        mock_pipe.model = MagicMock()
-        mock_pipe.tokenizer = MagicMock()
-        mock_pipeline.return_value = mock_pipe
-
         result = fetch_model(
             model_id="test/model",
             output_dir=output_dir,
@@ -188,7 +188,7 @@ class TestFetchModel:
         )
 
         # The download pins to the RESOLVED SHA, never the mutable ref
-        mock_pipeline.assert_called_once_with(
+        hub.pipeline.assert_called_once_with(
             task="text-classification",
             model="test/model",
             revision=RESOLVED_SHA,
@@ -198,6 +198,6 @@ class TestFetchModel:
                 "use_safetensors": True,
             },
         )
-        mock_model_info.assert_called_once_with("test/model", revision="v1.0")
+        hub.model_info.assert_called_once_with("test/model", revision="v1.0")
         assert result.requested_revision == "v1.0"
         assert result.resolved_revision == RESOLVED_SHA
@@ -1,7 +1,7 @@
 """Unit tests for load_data module."""
 
 import io
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 from urllib.error import HTTPError, URLError
 
 import pytest
@@ -13,32 +13,31 @@ from pipelines.shared.exceptions import (
 )
 from pipelines.training.src.load_data import LoadResult, load_data, validate_url
 
+# Header plus two data rows, shared by the successful-download tests.
+CSV_PAYLOAD = b"col1,col2\n1,2\n3,4\n"
+
 
 class TestValidateUrl:
     """Tests for URL validation."""
 
-    def test_valid_https_url(self):
-        """Test that valid HTTPS URLs pass validation."""
-        assert validate_url("https://example.com/data.csv") is True
-
-    def test_valid_http_url(self):
-        """Test that valid HTTP URLs pass validation."""
-        assert validate_url("http://example.com/data.csv") is True
-
-    def test_invalid_scheme(self):
-        """Test that unsupported schemes raise InvalidURLError."""
-        with pytest.raises(InvalidURLError, match="Unsupported URL scheme"):
-            validate_url("ftp://example.com/data.csv")
-
-    def test_missing_scheme(self):
-        """Test that URLs without scheme raise InvalidURLError."""
-        with pytest.raises(InvalidURLError, match="Invalid URL format"):
-            validate_url("example.com/data.csv")
-
-    def test_empty_url(self):
-        """Test that empty URLs raise InvalidURLError."""
-        with pytest.raises(InvalidURLError, match="Invalid URL format"):
-            validate_url("")
+    @pytest.mark.parametrize("url", ["https://example.com/data.csv", "http://example.com/data.csv"])
+    def test_valid_url(self, url):
+        """Test that HTTP(S) URLs pass validation."""
+        assert validate_url(url) is True
+
+    @pytest.mark.parametrize(
+        ("url", "match"),
+        [
+            ("ftp://example.com/data.csv", "Unsupported URL scheme"),
+            ("example.com/data.csv", "Invalid URL format"),
+            ("", "Invalid URL format"),
+        ],
+        ids=["unsupported-scheme", "missing-scheme", "empty"],
+    )
+    def test_invalid_url(self, url, match):
+        """Test that unsupported, scheme-less and empty URLs raise InvalidURLError."""
+        with pytest.raises(InvalidURLError, match=match):
+            validate_url(url)
 
 
 class TestLoadData:
@@ -47,14 +46,12 @@ class TestLoadData:
     def test_successful_download(self, temp_dir):
         """Test successful data download."""
         output_path = str(temp_dir / "output.csv")
-        test_content = b"col1,col2\n1,2\n3,4\n"
-
-        mock_response = MagicMock()
-        mock_response.read.return_value = test_content
-        mock_response.__enter__ = MagicMock(return_value=io.BytesIO(test_content))
-        mock_response.__exit__ = MagicMock(return_value=False)
 
-        with patch("urllib.request.urlopen", return_value=mock_response):
+        # BytesIO is already a context manager yielding a readable stream,
+        # which is all load_data needs from the HTTP response.
+        with patch(
+            "pipelines.training.src.load_data._open_url", return_value=io.BytesIO(CSV_PAYLOAD)
+        ):
             result = load_data("https://example.com/data.csv", output_path)
 
             assert isinstance(result, LoadResult)
@@ -66,8 +63,8 @@ class TestLoadData:
         """Test handling of HTTP errors."""
         output_path = str(temp_dir / "output.csv")
 
-        with patch("urllib.request.urlopen") as mock_urlopen:
-            mock_urlopen.side_effect = HTTPError("https://example.com", 404, "Not Found", {}, None)
+        with patch("pipelines.training.src.load_data._open_url") as mock_open_url:
+            mock_open_url.side_effect = HTTPError("https://example.com", 404, "Not Found", {}, None)
 
             with pytest.raises(NetworkError, match="HTTP error"):
                 load_data("https://example.com/data.csv", output_path)
@@ -76,8 +73,8 @@ class TestLoadData:
         """Test handling of URL/network errors."""
         output_path = str(temp_dir / "output.csv")
 
-        with patch("urllib.request.urlopen") as mock_urlopen:
-            mock_urlopen.side_effect = URLError("Connection refused")
+        with patch("pipelines.training.src.load_data._open_url") as mock_open_url:
+            mock_open_url.side_effect = URLError("Connection refused")
 
             with pytest.raises(NetworkError, match="URL error"):
                 load_data("https://example.com/data.csv", output_path)
@@ -94,11 +91,9 @@ class TestLoadData:
         output_path = str(temp_dir / "output.csv")
         test_content = b"header\n"  # Only header, no data
 
-        mock_response = MagicMock()
-        mock_response.__enter__ = MagicMock(return_value=io.BytesIO(test_content))
-        mock_response.__exit__ = MagicMock(return_value=False)
-
-        with patch("urllib.request.urlopen", return_value=mock_response):
+        with patch(
+            "pipelines.training.src.load_data._open_url", return_value=io.BytesIO(test_content)
+        ):
             with pytest.raises(DataLoadError, match="empty"):
                 load_data("https://example.com/data.csv", output_path)
 
@@ -107,24 +102,18 @@ class TestLoadData:
         # Use an invalid path that will cause an OSError
         output_path = "/nonexistent/directory/output.csv"
 
-        mock_response = MagicMock()
-        mock_response.__enter__ = MagicMock(return_value=io.BytesIO(b"test\n"))
-        mock_response.__exit__ = MagicMock(return_value=False)
-
-        with patch("urllib.request.urlopen", return_value=mock_response):
+        with patch(
+            "pipelines.training.src.load_data._open_url", return_value=io.BytesIO(b"test\n")
+        ):
             with pytest.raises(DataLoadError, match="File system error"):
                 load_data("https://example.com/data.csv", output_path)
 
     def test_result_dataclass_fields(self, temp_dir):
         """Test that LoadResult contains expected fields."""
         output_path = str(temp_dir / "output.csv")
-        test_content = b"col1,col2\n1,2\n3,4\n5,6\n"
-
-        mock_response = MagicMock()
-        mock_response.__enter__ = MagicMock(return_value=io.BytesIO(test_content))
-        mock_response.__exit__ = MagicMock(return_value=False)
-
-        with patch("urllib.request.urlopen", return_value=mock_response):
+        with patch(
+            "pipelines.training.src.load_data._open_url", return_value=io.BytesIO(CSV_PAYLOAD)
+        ):
             result = load_data("https://example.com/data.csv", output_path)
 
             assert hasattr(result, "output_path")
@@ -1,7 +1,11 @@
 """Unit tests for logging_utils module."""
 
+import copy
 import json
 import logging
+import sys
+
+import pytest
 
 from pipelines.shared.logging_utils import (
     CorrelatedLoggerAdapter,
@@ -16,6 +20,43 @@ from pipelines.shared.logging_utils import (
     set_correlation_id,
 )
 
+# Built once: LogRecord.__init__ stamps the time, pid, and thread/process names.
+_PROTO_RECORD = logging.LogRecord(
+    name="test.logger",
+    level=logging.INFO,
+    pathname="test.py",
+    lineno=42,
+    msg="Test message",
+    args=(),
+    exc_info=None,
+)
+
+
+@pytest.fixture
+def log_record():
+    """Fresh copy of an INFO 'Test message' record; tests adjust fields they need."""
+    return copy.copy(_PROTO_RECORD)
+
+
+@pytest.fixture
+def caplog_logger(caplog):
+    """Factory for get_logger loggers whose records land in caplog unformatted.
+
+    A pre-attached NullHandler makes get_logger skip its StreamHandler and leave
+    propagation on, so records reach caplog without being rendered to stderr.
+    """
+    null_handler = logging.NullHandler()
+    names = []
+
+    def _make(name):
+        logging.getLogger(name).addHandler(null_handler)
+        names.append(name)
+        return get_logger(name, structured=False)
+
+    yield _make
+    for name in names:
+        logging.getLogger(name).removeHandler(null_handler)
+
 
 class TestCorrelationId:
     """Tests for correlation ID functions."""
@@ -28,8 +69,8 @@ class TestCorrelationId:
 
     def test_generate_correlation_id_unique(self):
         """Test that each call generates a unique ID."""
-        ids = {generate_correlation_id() for _ in range(100)}
-        assert len(ids) == 100
+        ids = {generate_correlation_id() for _ in range(16)}
+        assert len(ids) == 16
 
     def test_set_and_get_correlation_id(self):
         """Test setting and retrieving correlation ID."""
@@ -42,26 +83,26 @@ class TestCorrelationId:
         set_correlation_id("")
         cid = get_correlation_id()
         assert len(cid) == 36
+        assert get_correlation_id() == cid  # generated once, then stored
 
 
 class TestStructuredFormatter:
     """Tests for StructuredFormatter."""
 
-    def test_format_produces_valid_json(self):
+    def test_format_produces_valid_json(self, log_record):
         """Test that formatter produces valid JSON."""
         formatter = StructuredFormatter(service_name="test-service")
-        record = logging.LogRecord(
-            name="test.logger",
-            level=logging.INFO,
-            pathname="test.py",
-            lineno=42,
-            msg="Test message",
-            args=(),
-            exc_info=None,
-        )
-
-        output = formatter.format(record)
-        data = json.loads(output)
+
+        data = json.loads(formatter.format(log_record))
+
+        assert data["message"] == "Test message"
+        assert data["location"]["line"] == 42
+
+    def test_to_dict_includes_core_fields(self, log_record):
+        """Test that the payload carries level, message, service and location."""
+        formatter = StructuredFormatter(service_name="test-service")
+
+        data = formatter.to_dict(log_record)
 
         assert data["level"] == "INFO"
         assert data["message"] == "Test message"
@@ -69,27 +110,19 @@ class TestStructuredFormatter:
         assert "correlation_id" in data
         assert data["location"]["line"] == 42
 
-    def test_format_includes_exception_info(self):
+    def test_format_includes_exception_info(self, log_record):
         """Test that exceptions are properly formatted."""
         formatter = StructuredFormatter()
+        log_record.levelno = logging.ERROR
+        log_record.levelname = "ERROR"
+        log_record.msg = "Error occurred"
 
         try:
             raise ValueError("Test error")
         except ValueError:
-            import sys
-
-            record = logging.LogRecord(
-                name="test",
-                level=logging.ERROR,
-                pathname="test.py",
-                lineno=1,
-                msg="Error occurred",
-                args=(),
-                exc_info=sys.exc_info(),
-            )
+            log_record.exc_info = sys.exc_info()
 
-        output = formatter.format(record)
-        data = json.loads(output)
+        data = formatter.to_dict(log_record)
 
         assert "exception" in data
         assert data["exception"]["type"] == "ValueError"
@@ -99,21 +132,16 @@ class TestStructuredFormatter:
 class TestHumanReadableFormatter:
     """Tests for HumanReadableFormatter."""
 
-    def test_format_includes_short_correlation_id(self):
+    @pytest.fixture(scope="class")
+    def hr_formatter(self):
+        """One stateless formatter shared by the class's tests."""
+        return HumanReadableFormatter()
+
+    def test_format_includes_short_correlation_id(self, hr_formatter, log_record):
         """Test that format includes shortened correlation ID."""
         set_correlation_id("12345678-1234-1234-1234-123456789012")
-        formatter = HumanReadableFormatter()
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="test.py",
-            lineno=1,
-            msg="Test message",
-            args=(),
-            exc_info=None,
-        )
-
-        output = formatter.format(record)
+
+        output = hr_formatter.format(log_record)
 
         assert "[12345678]" in output
         assert "INFO" in output
@@ -133,40 +161,56 @@ class TestGetLogger:
         logger = get_logger("my.test.logger")
         assert logger.logger.name == "my.test.logger"
 
-    def test_logger_logs_with_extra_fields(self, capsys):
-        """Test that extra fields are processed without errors."""
-        logger = get_logger("test.extra.fields", structured=False)
-        # Should not raise any exceptions
+    @pytest.mark.parametrize(
+        "structured,formatter_cls",
+        [(True, StructuredFormatter), (False, HumanReadableFormatter)],
+        ids=["structured", "human-readable"],
+    )
+    def test_fresh_logger_gets_stream_handler(self, request, structured, formatter_cls):
+        """Test the handler wiring a logger gets on first use (unlike caplog_logger's)."""
+        name = f"test.fresh.{request.node.callspec.id}"
+        logger = get_logger(name, structured=structured)
+        underlying = logging.getLogger(name)
+        request.addfinalizer(underlying.handlers.clear)
+
+        (handler,) = underlying.handlers
+        assert type(handler) is logging.StreamHandler
+        assert isinstance(handler.formatter, formatter_cls)
+        assert logger.logger.propagate is False
+
+    def test_logger_logs_with_extra_fields(self, caplog_logger, caplog):
+        """Test that extra fields are attached to the record."""
+        logger = caplog_logger("test.extra.fields")
         logger.info("Test message", custom_field="value")
 
-        captured = capsys.readouterr()
-        assert "Test message" in captured.err
+        (record,) = caplog.records
+        assert record.getMessage() == "Test message"
+        assert record.extra_fields == {"custom_field": "value"}
 
 
 class TestStepLogging:
     """Tests for step logging helper functions."""
 
-    def test_log_step_start(self, capsys):
+    def test_log_step_start(self, caplog_logger, caplog):
         """Test log_step_start logs correct message."""
-        logger = get_logger("test.step.start", structured=False)
+        logger = caplog_logger("test.step.start")
         log_step_start(logger, "validate", input_file="data.csv")
 
-        captured = capsys.readouterr()
-        assert "Starting pipeline step: validate" in captured.err
+        assert caplog.messages == ["Starting pipeline step: validate"]
 
-    def test_log_step_complete(self, capsys):
+    def test_log_step_complete(self, caplog_logger, caplog):
         """Test log_step_complete logs correct message."""
-        logger = get_logger("test.step.complete", structured=False)
+        logger = caplog_logger("test.step.complete")
         log_step_complete(logger, "train", duration_seconds=10.5)
 
-        captured = capsys.readouterr()
-        assert "Completed pipeline step: train" in captured.err
+        assert caplog.messages == ["Completed pipeline step: train"]
 
-    def test_log_step_error(self, capsys):
+    def test_log_step_error(self, caplog_logger, caplog):
         """Test log_step_error logs error correctly."""
-        logger = get_logger("test.step.error", structured=False)
+        logger = caplog_logger("test.step.error")
         log_step_error(logger, "feature_engineering", ValueError("Test error"))
 
-        captured = capsys.readouterr()
-        assert "Error in pipeline step feature_engineering" in captured.err
-        assert "Test error" in captured.err
+        (record,) = caplog.records
+        assert record.levelno == logging.ERROR
+        assert "Error in pipeline step feature_engineering" in record.getMessage()
+        assert "Test error" in record.getMessage()
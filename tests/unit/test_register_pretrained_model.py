@@ -2,33 +2,54 @@
 
 import json
 import sys
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 
 from pipelines.pretrained.src.register_model import (
+    _parse_metadata_json,
     register_pretrained_model,
 )
-from pipelines.shared.exceptions import ModelRegistrationError
-
-
-@pytest.fixture
-def metadata_file(tmp_path):
-    """Create a temporary metadata.json file."""
-    metadata = {
-        "model_id": "distilbert/distilbert-base-uncased-finetuned-sst-2-english",
-        "task": "text-classification",
-        "model_dir": str(tmp_path / "model"),
-        "num_parameters": 66_000_000,
-        "pipeline_tag": "text-classification",
-        "test_input": "I love this product!",
-        "test_output": '[{"label": "POSITIVE", "score": 0.9998}]',
-        "success": True,
-        "requested_revision": None,
-        "resolved_revision": "714eb0fa89d2f80546fda750413ed43d93601a13",
-    }
-    path = tmp_path / "metadata.json"
-    path.write_text(json.dumps(metadata))
+from pipelines.shared.exceptions import MLflowTimeoutError, ModelRegistrationError
+
+# Output of a successful fetch step. model_dir is never read from disk -
+# the pipeline loader and MLflow are mocked - so a fixed placeholder lets
+# the file contents be encoded once at import.
+METADATA = {
+    "model_id": "distilbert/distilbert-base-uncased-finetuned-sst-2-english",
+    "task": "text-classification",
+    "num_parameters": 66_000_000,
+    "pipeline_tag": "text-classification",
+    "test_input": "I love this product!",
+    "test_output": '[{"label": "POSITIVE", "score": 0.9998}]',
+    "success": True,
+    "requested_revision": None,
+    "resolved_revision": "714eb0fa89d2f80546fda750413ed43d93601a13",
+    "model_dir": "/models/distilbert-sst2",
+}
+METADATA_JSON = json.dumps(METADATA).encode("utf-8")
+
+
+class RecordingClient:
+    """MlflowClient double that records the registry writes made on it."""
+
+    def __init__(self):
+        self.version_tags = []
+        self.alias_calls = []
+
+    def set_model_version_tag(self, *args):
+        self.version_tags.append(args)
+
+    def set_registered_model_alias(self, *args):
+        self.alias_calls.append(args)
+
+
+@pytest.fixture(scope="module")
+def metadata_file(tmp_path_factory):
+    """Write the metadata.json once per module; no test modifies it."""
+    path = tmp_path_factory.mktemp("metadata") / "metadata.json"
+    path.write_bytes(METADATA_JSON)
     return str(path)
 
 
@@ -60,10 +81,12 @@ class TestRegisterPretrainedModel:
     @patch("pipelines.pretrained.src.register_model.mlflow")
     @patch("pipelines.pretrained.src.register_model.hf_pipeline")
     @patch("pipelines.pretrained.src.register_model.run_with_timeout")
-    def test_register_success(self, mock_timeout, mock_hf_pipeline, mock_mlflow, metadata_file):
+    def test_register_success(
+        self, mock_timeout, mock_hf_pipeline, mock_mlflow, metadata_file, mlflow_run_stub
+    ):
         """Test successful model registration."""
         # Mock MLflow client
-        mock_client = MagicMock()
+        mock_client = RecordingClient()
         mock_timeout.return_value = mock_client
 
         # Mock transformers pipeline
@@ -71,15 +94,10 @@ class TestRegisterPretrainedModel:
         mock_hf_pipeline.return_value = mock_pipe
 
         # Mock MLflow run
-        mock_run = MagicMock()
-        mock_run.info.run_id = "test-run-123"
-        mock_mlflow.start_run.return_value.__enter__ = MagicMock(return_value=mock_run)
-        mock_mlflow.start_run.return_value.__exit__ = MagicMock(return_value=False)
+        mock_mlflow.start_run.return_value = mlflow_run_stub("test-run-123")
 
         # Mock model registration
-        mock_mv = MagicMock()
-        mock_mv.version = 1
-        mock_mlflow.register_model.return_value = mock_mv
+        mock_mlflow.register_model.return_value = SimpleNamespace(version=1)
 
         result = register_pretrained_model(
             metadata_path=metadata_file,
@@ -99,12 +117,14 @@ class TestRegisterPretrainedModel:
         # Verify MLflow was called correctly
         mock_mlflow.log_params.assert_called_once()
         mock_mlflow.transformers.log_model.assert_called_once()
-        mock_mlflow.register_model.assert_called_once_with(
-            "runs:/test-run-123/model", "sentiment-classifier"
-        )
-        mock_client.set_registered_model_alias.assert_called_once_with(
-            "sentiment-classifier", "champion", 1
-        )
+        assert mock_mlflow.register_model.call_args_list == [
+            call("runs:/test-run-123/model", "sentiment-classifier")
+        ]
+        assert mock_client.version_tags == [
+            ("sentiment-classifier", 1, "hf_model_id", METADATA["model_id"]),
+            ("sentiment-classifier", 1, "hf_revision", METADATA["resolved_revision"]),
+        ]
+        assert mock_client.alias_calls == [("sentiment-classifier", "champion", 1)]
 
     def test_register_missing_metadata_file(self, tmp_path):
         """Test failure when metadata file doesn't exist."""
@@ -127,11 +147,19 @@ class TestRegisterPretrainedModel:
                 mlflow_uri="http://localhost:5000",
             )
 
+    @pytest.mark.parametrize(
+        "text",
+        ["not valid json{{{", '["model_id"]', "42"],
+        ids=["malformed", "list", "scalar"],
+    )
+    def test_parse_metadata_json_rejects(self, text):
+        """Test that malformed JSON and non-object JSON are both rejected."""
+        with pytest.raises(ModelRegistrationError, match="Invalid metadata JSON"):
+            _parse_metadata_json(text)
+
     @patch("pipelines.pretrained.src.register_model.run_with_timeout")
     def test_register_mlflow_timeout(self, mock_timeout, metadata_file):
         """Test failure when MLflow connection times out."""
-        from pipelines.shared.exceptions import MLflowTimeoutError
-
         mock_timeout.side_effect = MLflowTimeoutError("Connection timed out")
 
         with pytest.raises(ModelRegistrationError, match="Connection timed out"):
@@ -162,18 +190,13 @@ class TestRegisterPretrainedModel:
     @patch("pipelines.pretrained.src.register_model.hf_pipeline")
     @patch("pipelines.pretrained.src.register_model.run_with_timeout")
     def test_register_logs_params_with_num_parameters(
-        self, mock_timeout, mock_hf_pipeline, mock_mlflow, metadata_file
+        self, mock_timeout, mock_hf_pipeline, mock_mlflow, metadata_file, mlflow_run_stub
     ):
         """Test that num_parameters is logged when present."""
-        mock_timeout.return_value = MagicMock()
-        mock_hf_pipeline.return_value = MagicMock()
-        mock_run = MagicMock()
-        mock_run.info.run_id = "run-456"
-        mock_mlflow.start_run.return_value.__enter__ = MagicMock(return_value=mock_run)
-        mock_mlflow.start_run.return_value.__exit__ = MagicMock(return_value=False)
-        mock_mv = MagicMock()
-        mock_mv.version = 2
-        mock_mlflow.register_model.return_value = mock_mv
+        mock_timeout.return_value = RecordingClient()
+        mock_hf_pipeline.return_value = object()
+        mock_mlflow.start_run.return_value = mlflow_run_stub("run-456")
+        mock_mlflow.register_model.return_value = SimpleNamespace(version=2)
 
         register_pretrained_model(
             metadata_path=metadata_file,
@@ -7,6 +7,37 @@ import pytest
 from pipelines.training.src.schema import IrisSchema
 
 
+def _one_row(**overrides):
+    """Build a single valid iris row with the given fields overridden."""
+    row = {
+        "sepal_length": 5.1,
+        "sepal_width": 3.5,
+        "petal_length": 1.4,
+        "petal_width": 0.2,
+        "species": "setosa",
+        **overrides,
+    }
+    return pd.DataFrame({column: [value] for column, value in row.items()})
+
+
+# Built once at import: validate() works on a copy, so tests can share them.
+_NULLS_DF = pd.DataFrame(
+    {
+        "sepal_length": [5.1, None],
+        "sepal_width": [3.5, 3.0],
+        "petal_length": [1.4, 1.4],
+        "petal_width": [0.2, None],
+        "species": ["setosa", "versicolor"],
+    }
+)
+_NEG_DF = _one_row(sepal_length=-1.0)
+_INVALID_SPECIES_DF = _one_row(species="unknown_species")
+_EXTRA_COLUMN_DF = _one_row(extra_feature=42.0)
+_TOO_BIG_DF = _one_row(sepal_length=100.0)
+# int, should coerce to float
+_INT_DF = _one_row(sepal_length=5, sepal_width=3, petal_length=1, petal_width=0)
+
+
 class TestIrisSchema:
     """Tests for IrisSchema validation."""
 
@@ -17,85 +48,31 @@ class TestIrisSchema:
 
     def test_allows_nulls(self):
         """Test that nullable columns accept null values."""
-        df = pd.DataFrame(
-            {
-                "sepal_length": [5.1, None],
-                "sepal_width": [3.5, 3.0],
-                "petal_length": [1.4, 1.4],
-                "petal_width": [0.2, None],
-                "species": ["setosa", "versicolor"],
-            }
-        )
-        validated = IrisSchema.validate(df)
+        validated = IrisSchema.validate(_NULLS_DF)
         assert len(validated) == 2
 
-    def test_rejects_negative_values(self):
-        """Test that negative measurements are rejected."""
-        df = pd.DataFrame(
-            {
-                "sepal_length": [-1.0],
-                "sepal_width": [3.5],
-                "petal_length": [1.4],
-                "petal_width": [0.2],
-                "species": ["setosa"],
-            }
-        )
-        with pytest.raises(pandera.errors.SchemaError):
-            IrisSchema.validate(df)
-
-    def test_rejects_invalid_species(self):
-        """Test that unknown species are rejected."""
-        df = pd.DataFrame(
-            {
-                "sepal_length": [5.1],
-                "sepal_width": [3.5],
-                "petal_length": [1.4],
-                "petal_width": [0.2],
-                "species": ["unknown_species"],
-            }
-        )
-        with pytest.raises(pandera.errors.SchemaError):
-            IrisSchema.validate(df)
+    @pytest.mark.parametrize(
+        "bad_df,match",
+        [
+            (_NEG_DF, "sepal_length must be non-negative"),
+            (_INVALID_SPECIES_DF, "species must be one of"),
+            (_TOO_BIG_DF, "sepal_length unreasonably large"),
+        ],
+        ids=["negative-values", "invalid-species", "unreasonably-large-values"],
+    )
+    def test_rejects_bad_values(self, bad_df, match):
+        """Test that out-of-range measurements and unknown species are rejected."""
+        with pytest.raises(pandera.errors.SchemaError, match=match):
+            IrisSchema.validate(bad_df)
 
     def test_allows_extra_columns(self):
         """Test that extra columns don't cause failures (strict=False)."""
-        df = pd.DataFrame(
-            {
-                "sepal_length": [5.1],
-                "sepal_width": [3.5],
-                "petal_length": [1.4],
-                "petal_width": [0.2],
-                "species": ["setosa"],
-                "extra_feature": [42.0],
-            }
-        )
-        validated = IrisSchema.validate(df)
+        validated = IrisSchema.validate(_EXTRA_COLUMN_DF)
         assert "extra_feature" in validated.columns
 
-    def test_rejects_unreasonably_large_values(self):
-        """Test that extremely large measurements are rejected."""
-        df = pd.DataFrame(
-            {
-                "sepal_length": [100.0],
-                "sepal_width": [3.5],
-                "petal_length": [1.4],
-                "petal_width": [0.2],
-                "species": ["setosa"],
-            }
-        )
-        with pytest.raises(pandera.errors.SchemaError):
-            IrisSchema.validate(df)
-
     def test_coerces_types(self):
         """Test that string numbers are coerced to float."""
-        df = pd.DataFrame(
-            {
-                "sepal_length": [5],  # int, should coerce to float
-                "sepal_width": [3],
-                "petal_length": [1],
-                "petal_width": [0],
-                "species": ["setosa"],
-            }
-        )
-        validated = IrisSchema.validate(df)
+        validated = IrisSchema.validate(_INT_DF)
         assert validated["sepal_length"].dtype == float
+        # The shared input frame is left untouched
+        assert _INT_DF["sepal_length"].dtype != float
@@ -1,6 +1,7 @@
 """Unit tests for train_model module."""
 
-from unittest.mock import MagicMock
+import os
+from unittest.mock import DEFAULT
 
 import pytest
 
@@ -8,27 +9,40 @@ from pipelines.shared.exceptions import ModelTrainingError
 from pipelines.training.src.train_model import TrainingResult, train_model
 
 
+def _noop(*args, **kwargs):
+    return None
+
+
+@pytest.fixture
+def mlflow_mocks(mocker, mlflow_run_stub):
+    """Patch every MLflow call train_model makes, in one place.
+
+    Returns the recording mocks keyed by name; start_run yields a stub run
+    with ID "test-run-123" unless a test swaps its return value. No test
+    asserts on the tracking setup, so those two calls are plain no-ops.
+    """
+    mocks = mocker.patch.multiple(
+        "mlflow",
+        set_tracking_uri=_noop,
+        set_experiment=_noop,
+        start_run=DEFAULT,
+        log_params=DEFAULT,
+        log_metrics=DEFAULT,
+        log_metric=DEFAULT,
+    )
+    mocks["start_run"].return_value = mlflow_run_stub("test-run-123")
+    mocks["log_model"] = mocker.patch("mlflow.sklearn.log_model")
+    return mocks
+
+
+@pytest.mark.usefixtures("mlflow_mocks")
 class TestTrainModel:
     """Tests for train_model function."""
 
-    def test_successful_training(self, trained_model_artifacts, mocker):
+    def test_successful_training(self, trained_model_artifacts, mlflow_mocks):
         """Test successful model training with mocked MLflow."""
         artifacts = trained_model_artifacts
 
-        # Mock MLflow
-        mocker.patch("mlflow.set_tracking_uri")
-        mocker.patch("mlflow.set_experiment")
-
-        mock_run = MagicMock()
-        mock_run.info.run_id = "test-run-123"
-        mock_run.__enter__ = MagicMock(return_value=mock_run)
-        mock_run.__exit__ = MagicMock(return_value=False)
-
-        mocker.patch("mlflow.start_run", return_value=mock_run)
-        mock_log_params = mocker.patch("mlflow.log_params")
-        mock_log_metrics = mocker.patch("mlflow.log_metrics")
-        mock_log_model = mocker.patch("mlflow.sklearn.log_model")
-
         result = train_model(
             input_path=artifacts["data_path"],
             model_output_path=artifacts["model_path"],
@@ -49,15 +63,12 @@ class TestTrainModel:
         assert 0.0 <= result.f1 <= 1.0
 
         # Verify MLflow tracking calls
-        mock_log_params.assert_called()
-        mock_log_metrics.assert_called()
-        mock_log_model.assert_called_once()
+        mlflow_mocks["log_params"].assert_called()
+        mlflow_mocks["log_metrics"].assert_called()
+        mlflow_mocks["log_model"].assert_called_once()
 
-    def test_file_not_found(self, temp_dir, mocker):
+    def test_file_not_found(self, temp_dir):
         """Test handling of missing input file."""
-        mocker.patch("mlflow.set_tracking_uri")
-        mocker.patch("mlflow.set_experiment")
-
         with pytest.raises(ModelTrainingError, match="not found"):
             train_model(
                 input_path="/nonexistent/file.csv",
@@ -72,13 +83,10 @@ class TestTrainModel:
                 accuracy_output_path=str(temp_dir / "accuracy.txt"),
             )
 
-    def test_missing_target_column(self, trained_model_artifacts, mocker):
+    def test_missing_target_column(self, trained_model_artifacts):
         """Test error when target column doesn't exist."""
         artifacts = trained_model_artifacts
 
-        mocker.patch("mlflow.set_tracking_uri")
-        mocker.patch("mlflow.set_experiment")
-
         with pytest.raises(ModelTrainingError, match="not found"):
             train_model(
                 input_path=artifacts["data_path"],
@@ -93,23 +101,10 @@ class TestTrainModel:
                 accuracy_output_path=artifacts["accuracy_path"],
             )
 
-    def test_model_saved_to_disk(self, trained_model_artifacts, temp_dir, mocker):
+    def test_model_saved_to_disk(self, trained_model_artifacts):
         """Test that model is saved to specified path."""
         artifacts = trained_model_artifacts
 
-        mocker.patch("mlflow.set_tracking_uri")
-        mocker.patch("mlflow.set_experiment")
-
-        mock_run = MagicMock()
-        mock_run.info.run_id = "test-run-123"
-        mock_run.__enter__ = MagicMock(return_value=mock_run)
-        mock_run.__exit__ = MagicMock(return_value=False)
-
-        mocker.patch("mlflow.start_run", return_value=mock_run)
-        mocker.patch("mlflow.log_params")
-        mocker.patch("mlflow.log_metrics")
-        mocker.patch("mlflow.sklearn.log_model")
-
         train_model(
             input_path=artifacts["data_path"],
             model_output_path=artifacts["model_path"],
@@ -123,26 +118,13 @@ class TestTrainModel:
             accuracy_output_path=artifacts["accuracy_path"],
         )
 
-        import os
-
         assert os.path.exists(artifacts["model_path"])
 
-    def test_run_id_saved(self, trained_model_artifacts, mocker):
+    def test_run_id_saved(self, trained_model_artifacts, mlflow_mocks, mlflow_run_stub):
         """Test that run ID is saved to file."""
         artifacts = trained_model_artifacts
 
-        mocker.patch("mlflow.set_tracking_uri")
-        mocker.patch("mlflow.set_experiment")
-
-        mock_run = MagicMock()
-        mock_run.info.run_id = "test-run-456"
-        mock_run.__enter__ = MagicMock(return_value=mock_run)
-        mock_run.__exit__ = MagicMock(return_value=False)
-
-        mocker.patch("mlflow.start_run", return_value=mock_run)
-        mocker.patch("mlflow.log_params")
-        mocker.patch("mlflow.log_metrics")
-        mocker.patch("mlflow.sklearn.log_model")
+        mlflow_mocks["start_run"].return_value = mlflow_run_stub("test-run-456")
 
         train_model(
             input_path=artifacts["data_path"],
@@ -161,22 +143,11 @@ class TestTrainModel:
             saved_run_id = f.read()
         assert saved_run_id == "test-run-456"
 
-    def test_result_dataclass_fields(self, trained_model_artifacts, mocker):
+    def test_result_dataclass_fields(self, trained_model_artifacts, mlflow_mocks, mlflow_run_stub):
         """Test that TrainingResult contains expected fields."""
         artifacts = trained_model_artifacts
 
-        mocker.patch("mlflow.set_tracking_uri")
-        mocker.patch("mlflow.set_experiment")
-
-        mock_run = MagicMock()
-        mock_run.info.run_id = "test-run-789"
-        mock_run.__enter__ = MagicMock(return_value=mock_run)
-        mock_run.__exit__ = MagicMock(return_value=False)
-
-        mocker.patch("mlflow.start_run", return_value=mock_run)
-        mocker.patch("mlflow.log_params")
-        mocker.patch("mlflow.log_metrics")
-        mocker.patch("mlflow.sklearn.log_model")
+        mlflow_mocks["start_run"].return_value = mlflow_run_stub("test-run-789")
 
         result = train_model(
             input_path=artifacts["data_path"],
@@ -202,29 +173,14 @@ class TestTrainModel:
         assert hasattr(result, "best_params")
 
 
+@pytest.mark.slow
+@pytest.mark.usefixtures("mlflow_mocks")
 class TestGridSearch:
     """Tests for GridSearchCV hyperparameter tuning."""
 
-    def _mock_mlflow(self, mocker):
-        """Helper to set up MLflow mocks."""
-        mocker.patch("mlflow.set_tracking_uri")
-        mocker.patch("mlflow.set_experiment")
-
-        mock_run = MagicMock()
-        mock_run.info.run_id = "grid-search-run"
-        mock_run.__enter__ = MagicMock(return_value=mock_run)
-        mock_run.__exit__ = MagicMock(return_value=False)
-
-        mocker.patch("mlflow.start_run", return_value=mock_run)
-        mocker.patch("mlflow.log_params")
-        mock_log_metrics = mocker.patch("mlflow.log_metrics")
-        mocker.patch("mlflow.sklearn.log_model")
-        return mock_log_metrics
-
-    def test_grid_search_enabled(self, trained_model_artifacts, mocker):
+    def test_grid_search_enabled(self, trained_model_artifacts):
         """Test that GridSearchCV populates best_params when enabled."""
         artifacts = trained_model_artifacts
-        self._mock_mlflow(mocker)
 
         result = train_model(
             input_path=artifacts["data_path"],
@@ -245,10 +201,9 @@ class TestGridSearch:
         assert "n_estimators" in result.best_params
         assert "max_depth" in result.best_params
 
-    def test_grid_search_disabled_by_default(self, trained_model_artifacts, mocker):
+    def test_grid_search_disabled_by_default(self, trained_model_artifacts):
         """Test that best_params is None when grid search is not used."""
         artifacts = trained_model_artifacts
-        self._mock_mlflow(mocker)
 
         result = train_model(
             input_path=artifacts["data_path"],
@@ -265,12 +220,9 @@ class TestGridSearch:
 
         assert result.best_params is None
 
-    def test_grid_search_logs_to_mlflow(self, trained_model_artifacts, mocker):
+    def test_grid_search_logs_to_mlflow(self, trained_model_artifacts, mlflow_mocks):
         """Test that GridSearchCV results are logged to MLflow."""
         artifacts = trained_model_artifacts
-        self._mock_mlflow(mocker)
-        mock_log_params = mocker.patch("mlflow.log_params")
-        mock_log_metric = mocker.patch("mlflow.log_metric")
 
         train_model(
             input_path=artifacts["data_path"],
@@ -288,10 +240,10 @@ class TestGridSearch:
 
         # Check that best params were logged
         all_params = {}
-        for call in mock_log_params.call_args_list:
+        for call in mlflow_mocks["log_params"].call_args_list:
             all_params.update(call[0][0])
         assert any(k.startswith("best_") for k in all_params)
 
         # Check that grid_search_best_score metric was logged
-        metric_names = [call[0][0] for call in mock_log_metric.call_args_list]
+        metric_names = [call[0][0] for call in mlflow_mocks["log_metric"].call_args_list]
         assert "grid_search_best_score" in metric_names
@@ -1,5 +1,7 @@
 """Unit tests for validate_data module."""
 
+import os
+
 import pytest
 
 from pipelines.shared.exceptions import (
@@ -10,13 +12,31 @@ from pipelines.shared.exceptions import (
 from pipelines.training.src.validate_data import ValidationResult, validate_data
 
 
+@pytest.fixture(scope="module")
+def output_dir(tmp_path_factory):
+    """One directory for every test's validated CSV in this module."""
+    return tmp_path_factory.mktemp("validate")
+
+
+@pytest.fixture
+def output_path(output_dir, request):
+    """Per-test output CSV path, removed again after the test."""
+    path = output_dir / f"{request.node.name}.csv"
+    yield str(path)
+    path.unlink(missing_ok=True)
+
+
+@pytest.fixture
+def missing_csv_path():
+    """Input path that does not exist."""
+    return "/nonexistent/file.csv"
+
+
 class TestValidateData:
     """Tests for validate_data function."""
 
-    def test_successful_validation(self, iris_csv_path, temp_dir):
+    def test_successful_validation(self, iris_csv_path, output_path):
         """Test successful validation of clean data."""
-        output_path = str(temp_dir / "validated.csv")
-
         result = validate_data(iris_csv_path, output_path)
 
         assert isinstance(result, ValidationResult)
@@ -26,10 +46,8 @@ class TestValidateData:
         assert result.null_count == 0
         assert result.rows_removed == 0
 
-    def test_validation_with_nulls_imputation(self, csv_with_nulls_path, temp_dir):
+    def test_validation_with_nulls_imputation(self, csv_with_nulls_path, output_path):
         """Test validation imputes null values by default."""
-        output_path = str(temp_dir / "validated.csv")
-
         result = validate_data(csv_with_nulls_path, output_path, min_rows=5)
 
         assert result.success is True
@@ -41,10 +59,8 @@ class TestValidateData:
         # Check that imputation happened
         assert len(result.imputed_columns) > 0
 
-    def test_validation_with_drop_null_rows(self, csv_with_nulls_path, temp_dir):
+    def test_validation_with_drop_null_rows(self, csv_with_nulls_path, output_path):
         """Test validation drops rows when drop_all_null_rows=True."""
-        output_path = str(temp_dir / "validated.csv")
-
         result = validate_data(
             csv_with_nulls_path, output_path, min_rows=5, drop_all_null_rows=True
         )
@@ -56,43 +72,25 @@ class TestValidateData:
         assert result.clean_rows == 15
         assert result.null_count > 0
 
-    def test_file_not_found(self, temp_dir):
-        """Test handling of missing input file."""
-        output_path = str(temp_dir / "validated.csv")
-
-        with pytest.raises(DataValidationError, match="not found"):
-            validate_data("/nonexistent/file.csv", output_path)
-
-    def test_empty_file(self, empty_csv_path, temp_dir):
-        """Test handling of empty CSV file (headers only)."""
-        output_path = str(temp_dir / "validated.csv")
-
-        with pytest.raises(EmptyDataError, match="no rows"):
-            validate_data(empty_csv_path, output_path)
-
-    def test_insufficient_data_after_cleaning(self, all_null_csv_path, temp_dir):
-        """Test error when cleaned data has insufficient rows."""
-        output_path = str(temp_dir / "validated.csv")
-
-        with pytest.raises(InsufficientDataError, match="minimum required"):
-            validate_data(all_null_csv_path, output_path, min_rows=10)
-
-    def test_custom_min_rows(self, csv_with_nulls_path, temp_dir):
-        """Test validation with custom minimum rows threshold."""
-        output_path = str(temp_dir / "validated.csv")
-
-        # Should succeed with low threshold
-        result = validate_data(csv_with_nulls_path, output_path, min_rows=5)
-        assert result.success is True
-
-        # Should fail with high threshold
-        with pytest.raises(InsufficientDataError):
-            validate_data(csv_with_nulls_path, output_path, min_rows=50)
-
-    def test_result_dataclass_fields(self, iris_csv_path, temp_dir):
+    @pytest.mark.parametrize(
+        "input_fixture,kwargs,exc,match",
+        [
+            ("missing_csv_path", {}, DataValidationError, "not found"),
+            ("empty_csv_path", {}, EmptyDataError, "no rows"),
+            ("all_null_csv_path", {"min_rows": 10}, InsufficientDataError, "minimum required"),
+            ("csv_with_nulls_path", {"min_rows": 50}, InsufficientDataError, "minimum required"),
+        ],
+        ids=["file-not-found", "empty-file", "all-null-rows", "below-custom-min-rows"],
+    )
+    def test_validation_failure(self, request, input_fixture, kwargs, exc, match, output_path):
+        """Test that missing, empty or too-small inputs raise the matching error."""
+        input_path = request.getfixturevalue(input_fixture)
+
+        with pytest.raises(exc, match=match):
+            validate_data(input_path, output_path, **kwargs)
+
+    def test_result_dataclass_fields(self, iris_csv_path, output_path):
         """Test that ValidationResult contains expected fields."""
-        output_path = str(temp_dir / "validated.csv")
-
         result = validate_data(iris_csv_path, output_path)
 
         assert hasattr(result, "output_path")
@@ -105,11 +103,9 @@ class TestValidateData:
         assert hasattr(result, "success")
         assert hasattr(result, "error_message")
 
-    def test_output_file_created(self, iris_csv_path, temp_dir):
+    def test_output_file_created(self, iris_csv_path, output_path):
         """Test that output file is created after validation."""
-        output_path = temp_dir / "validated.csv"
-
-        result = validate_data(iris_csv_path, str(output_path))
+        result = validate_data(iris_csv_path, output_path)
 
-        assert output_path.exists()
-        assert result.output_path == str(output_path)
+        assert os.path.exists(output_path)
+        assert result.output_path == output_path
@@ -8,53 +8,71 @@ from pipelines.shared.exceptions import ModelTrainingError
 from pipelines.training.src.validate_model import ModelValidationResult, validate_model
 
 
-@pytest.fixture
-def trained_iris_model(temp_dir, iris_csv_path):
-    """Train a real model and save it for validation tests."""
-    import pandas as pd
-
-    df = pd.read_csv(iris_csv_path)
+@pytest.fixture(scope="session")
+def trained_iris_model(tmp_path_factory, iris_dataframe):
+    """Train a real model and save it for validation tests.
+
+    Session-scoped: no test modifies the saved model, so it is fitted once.
+    Trained on the same frame iris_csv_path is written from.
+    """
+    df = iris_dataframe
     X = df.drop(columns=["species"])
     y = df["species"]
 
-    model = RandomForestClassifier(n_estimators=10, max_depth=3, random_state=42)
+    model = RandomForestClassifier(n_estimators=2, max_depth=2, random_state=42, n_jobs=1)
     model.fit(X, y)
 
-    model_path = str(temp_dir / "model.joblib")
+    model_path = str(tmp_path_factory.mktemp("models") / "model.joblib")
     joblib.dump(model, model_path)
     return model_path
 
 
-@pytest.fixture
-def degenerate_model(temp_dir, iris_csv_path):
+@pytest.fixture(scope="session")
+def degenerate_model(tmp_path_factory, iris_dataframe):
     """Train on single-class data so the model only ever predicts one class."""
-    import pandas as pd
-
-    df = pd.read_csv(iris_csv_path)
+    df = iris_dataframe
     # Keep only 'setosa' rows — model will only learn one class
     df_single = df[df["species"] == "setosa"]
     X = df_single.drop(columns=["species"])
     y = df_single["species"]
 
-    model = RandomForestClassifier(n_estimators=5, random_state=42)
+    model = RandomForestClassifier(n_estimators=1, random_state=42, n_jobs=1)
     model.fit(X, y)
 
-    model_path = str(temp_dir / "degenerate_model.joblib")
+    model_path = str(tmp_path_factory.mktemp("models") / "degenerate_model.joblib")
     joblib.dump(model, model_path)
     return model_path
 
 
+@pytest.fixture(scope="module")
+def tiny_iris_csv_path(input_dir, iris_dataframe):
+    """Two rows per species - enough to exercise the passing path.
+
+    Checks that depend on the full distribution (the accuracy and class
+    diversity failures) keep using iris_csv_path.
+    """
+    csv_path = input_dir / "tiny_iris.csv"
+    iris_dataframe.iloc[[0, 1, 50, 51, 100, 101]].to_csv(csv_path, index=False)
+    return str(csv_path)
+
+
+@pytest.fixture(scope="module")
+def passing_result(trained_iris_model, tiny_iris_csv_path):
+    """Validate the trained model once; tests only read the result."""
+    return validate_model(
+        model_path=trained_iris_model,
+        data_path=tiny_iris_csv_path,
+        target="species",
+        accuracy_threshold=0.5,
+    )
+
+
 class TestValidateModel:
     """Tests for validate_model function."""
 
-    def test_passing_validation(self, trained_iris_model, iris_csv_path):
+    def test_passing_validation(self, passing_result):
         """Test model that meets all criteria passes."""
-        result = validate_model(
-            model_path=trained_iris_model,
-            data_path=iris_csv_path,
-            target="species",
-            accuracy_threshold=0.5,
-        )
+        result = passing_result
 
         assert isinstance(result, ModelValidationResult)
         assert result.passed is True
@@ -87,54 +105,32 @@ class TestValidateModel:
 
         assert result.checks["class_diversity"] is False
 
-    def test_model_not_found(self, iris_csv_path):
-        """Test error when model file doesn't exist."""
-        with pytest.raises(ModelTrainingError, match="not found"):
-            validate_model(
-                model_path="/nonexistent/model.joblib",
-                data_path=iris_csv_path,
-                target="species",
-                accuracy_threshold=0.5,
-            )
-
-    def test_data_not_found(self, trained_iris_model):
-        """Test error when data file doesn't exist."""
-        with pytest.raises(ModelTrainingError, match="not found"):
-            validate_model(
-                model_path=trained_iris_model,
-                data_path="/nonexistent/data.csv",
-                target="species",
-                accuracy_threshold=0.5,
-            )
-
-    def test_missing_target_column(self, trained_iris_model, iris_csv_path):
-        """Test error when target column doesn't exist in data."""
-        with pytest.raises(ModelTrainingError, match="not found"):
-            validate_model(
-                model_path=trained_iris_model,
-                data_path=iris_csv_path,
-                target="nonexistent",
-                accuracy_threshold=0.5,
-            )
-
-    def test_invalid_threshold(self, trained_iris_model, iris_csv_path):
-        """Test error for out-of-range threshold."""
-        with pytest.raises(ModelTrainingError, match="between 0 and 1"):
-            validate_model(
-                model_path=trained_iris_model,
-                data_path=iris_csv_path,
-                target="species",
-                accuracy_threshold=1.5,
-            )
-
-    def test_result_dataclass_fields(self, trained_iris_model, iris_csv_path):
+    @pytest.mark.parametrize(
+        "overrides,match",
+        [
+            ({"model_path": "/nonexistent/model.joblib"}, "not found"),
+            ({"data_path": "/nonexistent/data.csv"}, "not found"),
+            ({"target": "nonexistent"}, "not found"),
+            ({"accuracy_threshold": 1.5}, "between 0 and 1"),
+        ],
+        ids=["model-not-found", "data-not-found", "missing-target-column", "invalid-threshold"],
+    )
+    def test_invalid_inputs(self, trained_iris_model, iris_csv_path, overrides, match):
+        """Test error for a missing model/data file, target column or bad threshold."""
+        kwargs = {
+            "model_path": trained_iris_model,
+            "data_path": iris_csv_path,
+            "target": "species",
+            "accuracy_threshold": 0.5,
+            **overrides,
+        }
+
+        with pytest.raises(ModelTrainingError, match=match):
+            validate_model(**kwargs)
+
+    def test_result_dataclass_fields(self, passing_result):
         """Test that ModelValidationResult has expected fields."""
-        result = validate_model(
-            model_path=trained_iris_model,
-            data_path=iris_csv_path,
-            target="species",
-            accuracy_threshold=0.5,
-        )
+        result = passing_result
 
         assert hasattr(result, "passed")
         assert hasattr(result, "accuracy")